@@ -125,3 +125,104 @@ def test_graceful_shutdown_event():
     orchestrator._on_shutdown_request(event)
 
     assert orchestrator._shutdown_requested
+
+def test_shutdown_cancel_keeps_workers_waiting_for_slot(tmp_path):
+    """Test that workers queued for a slot survive a shutdown press-then-cancel."""
+    import threading
+    from vbc.domain.models import VideoFile
+
+    config = AppConfig(general=GeneralConfig(threads=1))
+
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=MagicMock(),
+        file_scanner=MagicMock(),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=MagicMock(),
+        ffmpeg_adapter=MagicMock()
+    )
+    orchestrator._active_threads = 1  # the only slot is busy
+
+    admitted = threading.Event()
+
+    def fake_process_metadata_request(video_file, initial_job=None):
+        admitted.set()
+
+    orchestrator._process_metadata_request = fake_process_metadata_request
+    video = VideoFile(path=tmp_path / "queued.mp4", size_bytes=10)
+    video.metadata_request = MagicMock()
+    worker = threading.Thread(target=orchestrator._process_file, args=(video, tmp_path))
+    worker.start()
+
+    orchestrator._on_shutdown_request(RequestShutdown())  # press S
+    worker.join(timeout=0.2)
+    assert worker.is_alive()  # still parked, not dropped
+
+    orchestrator._on_shutdown_request(RequestShutdown())  # cancel
+    with orchestrator._thread_lock:
+        orchestrator._active_threads -= 1  # the running job finishes
+        orchestrator._thread_lock.notify()
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert admitted.is_set()
+    assert orchestrator._active_threads == 0
+
+
+def test_interrupt_releases_workers_waiting_for_slot(tmp_path):
+    """Test that Ctrl+C lets queued workers exit without a free slot."""
+    import threading
+    from vbc.domain.events import InterruptRequested
+    from vbc.domain.models import VideoFile
+
+    config = AppConfig(general=GeneralConfig(threads=1))
+
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=MagicMock(),
+        file_scanner=MagicMock(),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=MagicMock(),
+        ffmpeg_adapter=MagicMock()
+    )
+    orchestrator._active_threads = 1  # the only slot is busy
+
+    video = VideoFile(path=tmp_path / "queued.mp4", size_bytes=10)
+    worker = threading.Thread(target=orchestrator._process_file, args=(video, tmp_path))
+    worker.start()
+
+    orchestrator._on_interrupt_requested(InterruptRequested())
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert orchestrator._active_threads == 1
+
+
+def test_critical_shutdown_releases_workers_waiting_for_slot(tmp_path):
+    """Test that a critical shutdown lets queued workers exit without a free slot."""
+    import threading
+    from vbc.domain.models import VideoFile
+
+    config = AppConfig(general=GeneralConfig(threads=1))
+
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=MagicMock(),
+        file_scanner=MagicMock(),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=MagicMock(),
+        ffmpeg_adapter=MagicMock()
+    )
+    orchestrator._active_threads = 1  # the only slot is busy
+
+    video = VideoFile(path=tmp_path / "queued.mp4", size_bytes=10)
+    worker = threading.Thread(target=orchestrator._process_file, args=(video, tmp_path))
+    worker.start()
+    worker.join(timeout=0.2)
+    assert worker.is_alive()  # parked on the slot condition
+
+    orchestrator._trigger_critical_shutdown("disk full")
+    worker.join(timeout=5)
+
+    assert not worker.is_alive()
+    assert orchestrator._active_threads == 1
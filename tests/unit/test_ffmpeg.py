@@ -237,7 +237,7 @@ def test_ffmpeg_compress_success(tmp_path):
         process_instance = mock_popen.return_value
         process_instance.stdout = [
             "frame= 100 fps=10.0 q=45.0 Lsize=100kB "
-            "time=00:00:05.00 dup=3 drop=5 speed=1.0x"
+            "time=00:00:05.00 bitrate= 163.8kbits/s dup=3 drop=5 speed=1.0x"
         ]
         process_instance.wait.return_value = 0
         process_instance.returncode = 0
@@ -250,6 +250,7 @@ def test_ffmpeg_compress_success(tmp_path):
         assert job.output_path.exists()
         assert not tmp_output.exists()
         assert job.expected_video_frames == 102
+        assert job.final_bitrate_bps == 163800
 
 
 def test_ffmpeg_waits_for_final_frame_line_after_process_exit(tmp_path):
@@ -1,7 +1,7 @@
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from vbc.infrastructure.file_scanner import FileScanner
+from vbc.infrastructure.file_scanner import FileScanner, iter_tree_files
 
 def test_file_scanner_basic(tmp_path):
     # Setup dummy directory structure
@@ -48,3 +48,21 @@ def test_file_scanner_ignore_out_dir(tmp_path):
     paths = {f.path.name for f in files}
     assert "video.mp4" in paths
     assert "compressed.mp4" not in paths
+
+def test_iter_tree_files_matches_walk_order(tmp_path):
+    (tmp_path / "b.mp4").write_text("data")
+    (tmp_path / "a.mp4").write_text("data")
+    (tmp_path / "z_dir").mkdir()
+    (tmp_path / "z_dir" / "c.mp4").write_text("data")
+    (tmp_path / "m_dir").mkdir()
+    (tmp_path / "m_dir" / "d.mp4").write_text("data")
+    (tmp_path / "m_out").mkdir()
+    (tmp_path / "m_out" / "e.mp4").write_text("data")
+    (tmp_path / "link_dir").symlink_to(tmp_path / "m_dir", target_is_directory=True)
+
+    names = [
+        Path(entry.path).relative_to(tmp_path).as_posix()
+        for entry in iter_tree_files(str(tmp_path))
+    ]
+
+    assert names == ["a.mp4", "b.mp4", "m_dir/d.mp4", "z_dir/c.mp4"]
@@ -126,3 +126,31 @@ def test_move_completed_file_renames_on_size_mismatch(tmp_path):
     assert not source.exists()
     assert dest.stat().st_size == 200
     assert dup.stat().st_size == 300
+
+
+def test_move_completed_file_large_same_size_checks_middle_bytes(tmp_path):
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "input_out"
+    input_dir.mkdir()
+    output_dir.mkdir()
+
+    size = 10 * 1024 * 1024
+    source = input_dir / "video.mp4"
+    video_file = _make_video(source, size)
+
+    # Head and tail match; only the middle differs, so the sampled check
+    # passes and the full hash has to reject the pair.
+    middle = bytearray(b"x" * size)
+    middle[size // 2] = ord("y")
+    dest = output_dir / "video.mp4"
+    dest.write_bytes(bytes(middle))
+
+    orchestrator = _make_orchestrator()
+    orchestrator._folder_mapping = {input_dir: output_dir}
+
+    assert orchestrator._move_completed_file(video_file, output_dir) is True
+
+    dup = output_dir / "video_vbc_dup.mp4"
+    assert dup.exists()
+    assert not source.exists()
+    assert dest.read_bytes() == bytes(middle)
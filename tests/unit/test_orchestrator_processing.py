@@ -1,5 +1,7 @@
 import os
+import shutil
 import subprocess
+from collections import deque
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -51,6 +53,42 @@ def test_sort_source_mtime_desc_uses_cached_source_timestamp(tmp_path):
     assert ordered == [newer, older]
 
 
+def test_sort_dir_groups_by_input_dir_without_matching_name_prefixes(tmp_path):
+    config = _make_config(queue_sort="dir", extensions=[".mp4"])
+    input_dir = tmp_path / "input"
+    sibling_dir = tmp_path / "input_b"
+    nested = VideoFile(path=input_dir / "sub" / "a.mp4", size_bytes=10)
+    top = VideoFile(path=input_dir / "b.mp4", size_bytes=10)
+    sibling = VideoFile(path=sibling_dir / "a.mp4", size_bytes=10)
+    stray = VideoFile(path=tmp_path / "other" / "a.mp4", size_bytes=10)
+
+    ordered = sort_files(
+        [stray, sibling, nested, top],
+        [sibling_dir, input_dir],
+        config.general,
+        config.general.extensions,
+    )
+
+    assert ordered == [sibling, top, nested, stray]
+
+
+def test_sort_size_desc_breaks_ties_by_name_then_path(tmp_path):
+    config = _make_config(queue_sort="size-desc", extensions=[".mp4"])
+    big = VideoFile(path=tmp_path / "z.mp4", size_bytes=30)
+    tie_b = VideoFile(path=tmp_path / "b" / "clip.mp4", size_bytes=10)
+    tie_a = VideoFile(path=tmp_path / "a" / "clip.mp4", size_bytes=10)
+    other = VideoFile(path=tmp_path / "a.mp4", size_bytes=10)
+
+    ordered = sort_files(
+        [tie_b, other, big, tie_a],
+        [tmp_path],
+        config.general,
+        config.general.extensions,
+    )
+
+    assert ordered == [big, other, tie_a, tie_b]
+
+
 def test_perform_discovery_counts_and_skips(tmp_path):
     input_dir = tmp_path / "input"
     input_dir.mkdir()
@@ -98,6 +136,41 @@ def test_perform_discovery_counts_and_skips(tmp_path):
     assert [vf.path.name for vf in files] == ["good.mp4"]
 
 
+def test_perform_discovery_checks_outputs_in_nested_dirs(tmp_path):
+    input_dir = tmp_path / "input"
+    (input_dir / "sub").mkdir(parents=True)
+    (input_dir / "other").mkdir()
+    output_sub = tmp_path / "input_out" / "sub"
+    output_sub.mkdir(parents=True)
+
+    done = input_dir / "sub" / "done.mp4"
+    stale = input_dir / "sub" / "stale.mp4"
+    fresh = input_dir / "other" / "fresh.mp4"
+    for source in (done, stale, fresh):
+        source.write_bytes(b"x" * 200)
+    done_out = output_sub / "done.mp4"
+    done_out.write_bytes(b"x" * 50)
+    os.utime(done_out, (done.stat().st_atime + 10, done.stat().st_mtime + 10))
+    stale_out = output_sub / "stale.mp4"
+    stale_out.write_bytes(b"x" * 50)
+    os.utime(stale_out, (stale.stat().st_atime - 10, stale.stat().st_mtime - 10))
+
+    config = _make_config(extensions=[".mp4"], use_exif=False)
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=EventBus(),
+        file_scanner=FileScanner(config.general.extensions, 0),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=MagicMock(),
+        ffmpeg_adapter=MagicMock(),
+    )
+
+    files, stats = orchestrator._perform_discovery(input_dir)
+
+    assert stats["already_compressed"] == 1
+    assert sorted(vf.path.name for vf in files) == ["fresh.mp4", "stale.mp4"]
+
+
 def test_perform_discovery_hw_cap_err_cleared_with_cpu_fallback(tmp_path):
     input_dir = tmp_path / "input"
     input_dir.mkdir()
@@ -163,6 +236,70 @@ def test_perform_discovery_sort_dir(tmp_path):
     ]
 
 
+def test_perform_discovery_merges_stats_across_input_dirs(tmp_path):
+    input_a = tmp_path / "input_a"
+    input_b = tmp_path / "input_b"
+    input_a.mkdir()
+    input_b.mkdir()
+    (input_a / "small.mp4").write_bytes(b"x")
+    (input_a / "keep.mp4").write_bytes(b"x" * 50)
+    (input_b / "broken.mp4").write_bytes(b"x" * 50)
+    (input_b / "keep.mp4").write_bytes(b"x" * 50)
+    err_dir = tmp_path / "input_b_out"
+    err_dir.mkdir()
+    (err_dir / "broken.err").write_text("bad file")
+
+    config = _make_config(extensions=[".mp4"], min_size_bytes=10, use_exif=False)
+    scanner = FileScanner(config.general.extensions, config.general.min_size_bytes)
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=EventBus(),
+        file_scanner=scanner,
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=MagicMock(),
+        ffmpeg_adapter=MagicMock(),
+    )
+
+    files, stats = orchestrator._perform_discovery([input_a, input_b])
+
+    assert [vf.path for vf in files] == [input_a / "keep.mp4", input_b / "keep.mp4"]
+    assert stats["files_found"] == 2
+    assert stats["ignored_small"] == 1
+    assert stats["ignored_err"] == 1
+    assert [entry.path for entry in stats["ignored_err_entries"]] == [
+        input_b / "broken.mp4"
+    ]
+
+
+def test_perform_discovery_hw_cap_marker_respects_cpu_fallback(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    (input_dir / "a.mp4").write_bytes(b"x" * 50)
+    out_dir = tmp_path / "input_out"
+    out_dir.mkdir()
+    marker = out_dir / "a.err"
+
+    for cpu_fallback, expected in ((False, []), (True, [input_dir / "a.mp4"])):
+        marker.write_text("Hardware is lacking required capabilities")
+        config = _make_config(
+            extensions=[".mp4"], use_exif=False, cpu_fallback=cpu_fallback
+        )
+        orchestrator = Orchestrator(
+            config=config,
+            event_bus=EventBus(),
+            file_scanner=FileScanner(config.general.extensions, 0),
+            exif_adapter=MagicMock(),
+            ffprobe_adapter=MagicMock(),
+            ffmpeg_adapter=MagicMock(),
+        )
+
+        files, stats = orchestrator._perform_discovery(input_dir)
+
+        assert [vf.path for vf in files] == expected
+        assert stats["ignored_err"] == 0
+        assert marker.exists() is not cpu_fallback
+
+
 def test_perform_discovery_sort_ext(tmp_path):
     input_dir = tmp_path / "input"
     input_dir.mkdir()
@@ -414,6 +551,70 @@ def test_process_file_invalid_dimensions_writes_err(tmp_path):
     assert ffmpeg.compress.call_count == 0
 
 
+def test_process_file_skipped_av1_does_not_remux_color_space(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    source = input_dir / "video.mp4"
+    source.write_bytes(b"a" * 1000)
+
+    config = _make_config(use_exif=False, copy_metadata=False, skip_av1=True)
+    ffprobe = MagicMock()
+    ffprobe.get_stream_info.return_value = {
+        "width": 1920,
+        "height": 1080,
+        "codec": "av1",
+        "fps": 30.0,
+        "color_space": "reserved",
+    }
+    ffmpeg = MagicMock()
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=EventBus(),
+        file_scanner=FileScanner([".mp4"], 0),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=ffprobe,
+        ffmpeg_adapter=ffmpeg,
+    )
+    orchestrator._check_and_fix_color_space = MagicMock(return_value=(source, None))
+
+    orchestrator._process_file(
+        VideoFile(path=source, size_bytes=source.stat().st_size),
+        input_dir,
+    )
+
+    orchestrator._check_and_fix_color_space.assert_not_called()
+    ffmpeg.compress.assert_not_called()
+
+
+def test_process_file_reuses_prefetched_metadata_from_cache(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    source = input_dir / "video.mp4"
+    source.write_bytes(b"a" * 1000)
+
+    config = _make_config(use_exif=False, copy_metadata=False, skip_av1=True)
+    ffprobe = MagicMock()
+    ffmpeg = MagicMock()
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=EventBus(),
+        file_scanner=FileScanner([".mp4"], 0),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=ffprobe,
+        ffmpeg_adapter=ffmpeg,
+    )
+    orchestrator._metadata_cache[source] = VideoMetadata(
+        width=1920, height=1080, codec="av1", fps=30.0
+    )
+
+    video_file = VideoFile(path=source, size_bytes=source.stat().st_size)
+    orchestrator._process_file(video_file, input_dir)
+
+    ffprobe.get_stream_info.assert_not_called()
+    assert video_file.metadata is orchestrator._metadata_cache[source]
+    ffmpeg.compress.assert_not_called()
+
+
 def test_process_file_success_ratio_keeps_original(tmp_path):
     input_dir = tmp_path / "input"
     input_dir.mkdir()
@@ -475,6 +676,85 @@ def test_process_file_success_ratio_keeps_original(tmp_path):
     ffprobe.get_stream_info.assert_not_called()
 
 
+def test_copy_file_clone_falls_back_when_reflink_unsupported(tmp_path):
+    import errno
+
+    from vbc.pipeline.orchestrator import _copy_file_clone
+
+    source = tmp_path / "source.mp4"
+    source.write_bytes(b"a" * 1000)
+    os.utime(source, (1_600_000_000, 1_600_000_000))
+    target = tmp_path / "target.mp4"
+    target.write_bytes(b"b" * 10)
+
+    with patch(
+        "vbc.pipeline.orchestrator.fcntl.ioctl",
+        side_effect=OSError(errno.EOPNOTSUPP, "Operation not supported"),
+    ) as ioctl:
+        _copy_file_clone(source, target)
+
+    ioctl.assert_called_once()
+    assert target.read_bytes() == source.read_bytes()
+    assert target.stat().st_mtime == source.stat().st_mtime
+
+
+def test_copy_file_clone_fallback_preserves_content_mtime_and_mode(tmp_path):
+    import stat
+
+    from vbc.pipeline.orchestrator import _copy_file_clone
+
+    source = tmp_path / "source.mp4"
+    source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+    source.chmod(0o640)
+    os.utime(source, (1_600_000_000, 1_600_000_000))
+    target = tmp_path / "target.mp4"
+
+    with patch(
+        "vbc.pipeline.orchestrator.fcntl.ioctl",
+        side_effect=OSError("clone refused"),
+    ), patch(
+        "vbc.pipeline.orchestrator.shutil.copy2", wraps=shutil.copy2
+    ) as copy2, patch("vbc.pipeline.orchestrator.sys.platform", "linux"):
+        _copy_file_clone(source, target)
+
+    copy2.assert_called_once_with(source, target)
+    assert target.read_bytes() == source.read_bytes()
+    assert target.stat().st_mtime == source.stat().st_mtime
+    assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+
+def test_copy_file_clone_skips_ioctl_off_linux(tmp_path):
+    from vbc.pipeline.orchestrator import _copy_file_clone
+
+    source = tmp_path / "source.mp4"
+    source.write_bytes(b"a" * 1000)
+    target = tmp_path / "target.mp4"
+
+    with patch("vbc.pipeline.orchestrator.sys.platform", "darwin"), patch(
+        "vbc.pipeline.orchestrator.fcntl.ioctl"
+    ) as ioctl:
+        _copy_file_clone(source, target)
+
+    ioctl.assert_not_called()
+    assert target.read_bytes() == source.read_bytes()
+
+
+def test_copy_file_clone_does_not_retry_when_destination_cannot_open(tmp_path):
+    import pytest
+
+    from vbc.pipeline.orchestrator import _copy_file_clone
+
+    source = tmp_path / "source.mp4"
+    source.write_bytes(b"a" * 1000)
+    target = tmp_path / "missing" / "target.mp4"
+
+    with patch("vbc.pipeline.orchestrator.shutil.copy2") as copy2:
+        with pytest.raises(FileNotFoundError):
+            _copy_file_clone(source, target)
+
+    copy2.assert_not_called()
+
+
 def test_process_file_success_ratio_keeps_original_skips_metadata_copy(tmp_path):
     input_dir = tmp_path / "input"
     input_dir.mkdir()
@@ -580,6 +860,52 @@ def test_process_file_success_ratio_pass_writes_tags(tmp_path, caplog):
     orchestrator._write_vbc_tags.assert_called_once()
 
 
+def test_process_file_releases_slot_before_writing_tags(tmp_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    source = input_dir / "video.mp4"
+    source.write_bytes(b"a" * 1000)
+
+    config = _make_config(use_exif=False, copy_metadata=False, min_compression_ratio=0.1)
+    ffprobe = MagicMock()
+    ffprobe.get_stream_info.return_value = {
+        "width": 1920,
+        "height": 1080,
+        "codec": "h264",
+        "fps": 30.0,
+    }
+    ffmpeg = MagicMock()
+
+    def fake_compress(job, *_args, **_kwargs):
+        job.status = JobStatus.COMPLETED
+        job.output_path.write_bytes(b"b" * 600)
+
+    ffmpeg.compress.side_effect = fake_compress
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=EventBus(),
+        file_scanner=FileScanner([".mp4"], 0),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=ffprobe,
+        ffmpeg_adapter=ffmpeg,
+    )
+    orchestrator._check_and_fix_color_space = MagicMock(return_value=(source, None))
+    slot_state = []
+    orchestrator._write_vbc_tags = MagicMock(
+        side_effect=lambda *_args, **_kwargs: slot_state.append(
+            (orchestrator._active_threads, orchestrator._finalizing_jobs)
+        )
+    )
+
+    orchestrator._process_file(
+        VideoFile(path=source, size_bytes=source.stat().st_size), input_dir
+    )
+
+    assert slot_state == [(0, 1)]
+    assert orchestrator._active_threads == 0
+    assert orchestrator._finalizing_jobs == 0
+
+
 def _required_vbc_tags_for_test() -> dict:
     return {
         "XMP:VBCOriginalName": "in.mp4",
@@ -941,6 +1267,130 @@ def test_run_once_skips_pending_metadata_preload_in_worker_mode(
     assert queue_states[0] == [False]
 
 
+def test_preload_pending_head_drops_failures_only_in_window(tmp_path):
+    config = _make_config(use_exif=False)
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=MagicMock(),
+        file_scanner=MagicMock(),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=MagicMock(),
+        ffmpeg_adapter=MagicMock(),
+    )
+    files = [VideoFile(path=tmp_path / f"{idx}.mp4", size_bytes=10) for idx in range(5)]
+    bad = files[1]
+
+    def load_metadata(video):
+        if video is bad:
+            orchestrator._metadata_failed_paths.add(video.path)
+            return None
+        return VideoMetadata(width=1, height=1, codec="h264", fps=1.0)
+
+    orchestrator._get_metadata = MagicMock(side_effect=load_metadata)
+    pending = deque(files)
+
+    removed = orchestrator._preload_pending_head(pending, limit=2)
+
+    assert removed == 1
+    assert list(pending) == [files[0], files[2], files[3], files[4]]
+    assert orchestrator._get_metadata.call_count == 3
+    assert files[3].metadata is None
+
+
+def test_probe_metadata_batch_overlaps_probes(tmp_path):
+    import threading
+
+    config = _make_config(use_exif=False)
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=MagicMock(),
+        file_scanner=MagicMock(),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=MagicMock(),
+        ffmpeg_adapter=MagicMock(),
+    )
+    files = [VideoFile(path=tmp_path / f"{idx}.mp4", size_bytes=10) for idx in range(2)]
+    barrier = threading.Barrier(2, timeout=5)
+
+    def load_metadata(_video):
+        # Both probes must be in flight at once for the barrier to release.
+        barrier.wait()
+        return VideoMetadata(width=1, height=1, codec="h264", fps=1.0)
+
+    orchestrator._get_metadata = MagicMock(side_effect=load_metadata)
+
+    orchestrator._probe_metadata_batch(files)
+
+    assert all(vf.metadata is not None for vf in files)
+
+
+def test_prefetch_pending_head_probes_in_background(tmp_path):
+    import concurrent.futures
+    import threading
+
+    config = _make_config(use_exif=False)
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=MagicMock(),
+        file_scanner=MagicMock(),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=MagicMock(),
+        ffmpeg_adapter=MagicMock(),
+    )
+    files = [VideoFile(path=tmp_path / f"{idx}.mp4", size_bytes=10) for idx in range(4)]
+    orchestrator._metadata_failed_paths.add(files[1].path)
+    release = threading.Event()
+
+    def load_metadata(_video):
+        release.wait(timeout=5)
+        return VideoMetadata(width=1, height=1, codec="h264", fps=1.0)
+
+    orchestrator._get_metadata = MagicMock(side_effect=load_metadata)
+    pending = deque(files)
+    prefetching = {}
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        orchestrator._prefetch_pending_head(pending, pool, prefetching, limit=2)
+        # Returns while probes are still blocked; failed entries leave the head.
+        assert list(pending) == [files[0], files[2], files[3]]
+        assert set(prefetching) == {files[0].path, files[2].path}
+        orchestrator._prefetch_pending_head(pending, pool, prefetching, limit=2)
+        assert orchestrator._get_metadata.call_count == 2
+        release.set()
+        concurrent.futures.wait(list(prefetching.values()), timeout=5)
+
+    assert files[0].metadata is not None
+    assert files[2].metadata is not None
+    assert files[3].metadata is None
+    assert orchestrator._loop_wakeup.is_set()
+
+
+def test_prefetch_pending_head_stops_after_shutdown_request(tmp_path):
+    config = _make_config(use_exif=False)
+    orchestrator = Orchestrator(
+        config=config,
+        event_bus=MagicMock(),
+        file_scanner=MagicMock(),
+        exif_adapter=MagicMock(),
+        ffprobe_adapter=MagicMock(),
+        ffmpeg_adapter=MagicMock(),
+    )
+    files = [VideoFile(path=tmp_path / f"{idx}.mp4", size_bytes=10) for idx in range(3)]
+    pending = deque(files)
+    prefetching = {}
+    pool = MagicMock()
+
+    orchestrator._shutdown_requested = True
+    orchestrator._prefetch_pending_head(pending, pool, prefetching)
+    orchestrator._shutdown_requested = False
+    orchestrator._shutdown_event.set()
+    orchestrator._prefetch_pending_head(pending, pool, prefetching)
+
+    pool.submit.assert_not_called()
+    assert prefetching == {}
+    assert list(pending) == files
+
+
 def test_worker_preflight_transitions_to_processing_in_same_slot(tmp_path):
     input_dir = tmp_path / "input"
     input_dir.mkdir()
@@ -2,7 +2,12 @@ import pytest
 from unittest.mock import MagicMock
 from collections import deque
 from pathlib import Path
-from vbc.domain.events import QueueUpdated, RefreshRequested, RequestShutdown
+from vbc.domain.events import (
+    QueueUpdated,
+    RefreshRequested,
+    RequestShutdown,
+    ThreadControlEvent,
+)
 from vbc.domain.models import VideoFile
 from vbc.pipeline.orchestrator import Orchestrator
 from vbc.config.models import AppConfig, GeneralConfig
@@ -48,7 +53,6 @@ def test_refresh_resorts_queue(mock_orchestrator):
     new_stats = {}
     
     mock_orchestrator._perform_discovery = MagicMock(return_value=(sorted_new_files, new_stats))
-    mock_orchestrator._prune_failed_pending = MagicMock()
     
     # Execute the logic extracted from run()
     # (Since we can't easily run the full run() loop in unit test without complex mocking,
@@ -93,7 +97,6 @@ def test_refresh_excludes_inflight(mock_orchestrator):
     
     sorted_new_files = [vf1_new, vf2_new, vf3_new]
     mock_orchestrator._perform_discovery = MagicMock(return_value=(sorted_new_files, {}))
-    mock_orchestrator._prune_failed_pending = MagicMock()
     
     # Execute logic
     in_flight_paths = {vf.path for vf in in_flight.values()}
@@ -198,6 +201,18 @@ def test_refresh_arriving_before_waiting_is_not_lost(tmp_path):
     orchestrator._wait_event.wait.assert_not_called()
 
 
+def test_refresh_and_raised_thread_limit_wake_submit_loop(mock_orchestrator):
+    mock_orchestrator._on_refresh_request(RefreshRequested())
+    assert mock_orchestrator._loop_wakeup.is_set()
+
+    mock_orchestrator._loop_wakeup.clear()
+    mock_orchestrator._on_thread_control(ThreadControlEvent(change=-1))
+    assert not mock_orchestrator._loop_wakeup.is_set()
+
+    mock_orchestrator._on_thread_control(ThreadControlEvent(change=1))
+    assert mock_orchestrator._loop_wakeup.is_set()
+
+
 def test_manifest_watch_paths_do_not_request_full_refresh(mock_orchestrator):
     first = Path("/tmp/metadata/first.json")
     second = Path("/tmp/metadata/second.json")
@@ -305,3 +320,50 @@ def test_manifest_watch_paths_start_incremental_wait_cycle(tmp_path):
 
     assert run_calls == [None, [manifest_path]]
     orchestrator._wait_event.wait.assert_not_called()
+
+
+def test_refresh_rescans_in_background_without_requeueing_dispatched(
+    mock_orchestrator,
+):
+    import threading
+
+    stats = {
+        "files_found": 2,
+        "files_to_process": 2,
+        "already_compressed": 0,
+        "ignored_small": 0,
+        "ignored_err": 0,
+        "ignored_err_entries": [],
+    }
+    first = VideoFile(path=Path("/tmp/a.mp4"), size_bytes=100)
+    second = VideoFile(path=Path("/tmp/b.mp4"), size_bytes=100)
+    added = VideoFile(path=Path("/tmp/c.mp4"), size_bytes=100)
+    rescan_released = threading.Event()
+    scans = []
+
+    def perform_discovery(_dirs, manifest_paths=None):
+        scans.append(manifest_paths)
+        if len(scans) == 1:
+            return [first, second], dict(stats)
+        # The rescan only finishes once the next job has been dispatched.
+        assert rescan_released.wait(timeout=5)
+        rediscovered = VideoFile(path=Path("/tmp/b.mp4"), size_bytes=100)
+        return [rediscovered, added], dict(stats)
+
+    processed = []
+
+    def process_file(video_file):
+        processed.append(video_file.path.name)
+        if video_file.path.name == "a.mp4":
+            mock_orchestrator._on_refresh_request(RefreshRequested())
+        elif video_file.path.name == "b.mp4":
+            rescan_released.set()
+
+    mock_orchestrator._perform_discovery = perform_discovery
+    mock_orchestrator._process_file = process_file
+    mock_orchestrator._get_metadata = MagicMock(return_value=None)
+
+    assert mock_orchestrator._run_once([Path("/tmp")]) is True
+
+    assert processed == ["a.mp4", "b.mp4", "c.mp4"]
+    assert len(scans) == 2
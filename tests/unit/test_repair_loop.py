@@ -1,3 +1,4 @@
+import threading
 from pathlib import Path
 
 from vbc.pipeline import repair as repair_mod
@@ -197,3 +198,75 @@ def test_repair_progress_updates_by_file_size_during_reencode(tmp_path, monkeypa
     processing_progress = _CaptureProgress.processing_instances[0]
     assert processing_progress.tasks[0]["total"] == 100
     assert any(update.get("completed") == 40 for update in processing_progress.updates)
+
+
+def test_repair_runs_candidates_concurrently_and_keeps_candidate_order(tmp_path, monkeypatch):
+    input_dir = tmp_path / "input"
+    errors_dir = tmp_path / "input_err"
+    input_dir.mkdir()
+    errors_dir.mkdir()
+
+    first = errors_dir / "a.flv"
+    second = errors_dir / "b.flv"
+    for candidate in (first, second):
+        candidate.write_bytes(b"x" * 10)
+        candidate.with_suffix(".err").write_text("failed")
+
+    # Both re-encodes must be running at once for the barrier to release.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_reencode(_src: Path, out: Path, progress_callback=None):
+        barrier.wait()
+        out.write_bytes(b"m" * 7)
+        return True
+
+    monkeypatch.setattr(repair_mod, "repair_flv_file", lambda *_args: False)
+    monkeypatch.setattr(repair_mod, "repair_via_reencode", fake_reencode)
+
+    repaired, paths = repair_mod.process_repairs(
+        input_dirs=[input_dir],
+        errors_dir_map={input_dir: errors_dir},
+        extensions=[".flv"],
+        logger=None,
+        target_files=[second, first],
+        return_repaired_files=True,
+        max_workers=2,
+    )
+
+    assert repaired == 2
+    assert paths == [input_dir / "b.mkv", input_dir / "a.mkv"]
+
+
+def test_repair_serializes_candidates_restoring_to_same_mkv(tmp_path, monkeypatch):
+    input_dir = tmp_path / "input"
+    errors_dir = tmp_path / "input_err"
+    input_dir.mkdir()
+    errors_dir.mkdir()
+
+    flv = errors_dir / "video.flv"
+    mp4 = errors_dir / "video.mp4"
+    for candidate in (flv, mp4):
+        candidate.write_bytes(b"x" * 10)
+    (errors_dir / "video.err").write_text("failed")
+
+    calls = []
+
+    def fake_reencode(src: Path, out: Path, progress_callback=None):
+        calls.append(src)
+        out.write_bytes(b"m" * 7)
+        return True
+
+    monkeypatch.setattr(repair_mod, "repair_flv_file", lambda *_args: False)
+    monkeypatch.setattr(repair_mod, "repair_via_reencode", fake_reencode)
+
+    repaired = repair_mod.process_repairs(
+        input_dirs=[input_dir],
+        errors_dir_map={input_dir: errors_dir},
+        extensions=[".flv", ".mp4"],
+        logger=None,
+        max_workers=2,
+    )
+
+    assert repaired == 1
+    assert calls == [flv]
+    assert (input_dir / "video.mkv").read_bytes() == b"m" * 7
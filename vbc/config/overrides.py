@@ -287,16 +287,18 @@ def build_job_config(
         - merged_config: Final configuration with all overrides applied
         - config_source_indicator: Highest priority source (GLOBAL, LOCAL, or CLI)
     """
-    # Start with global config (deep copy to avoid mutation)
-    config = base_config.model_copy(deep=True)
-    source = ConfigSource.GLOBAL
-
-    # Apply local config if exists
-    if local_registry:
-        local_entry = local_registry.get_applicable_config(file_path)
-        if local_entry:
-            config = merge_local_config(config, local_entry.data, None)
-            source = ConfigSource.LOCAL
+    local_entry = (
+        local_registry.get_applicable_config(file_path) if local_registry else None
+    )
+    if local_entry:
+        # merge_local_config only reads the base and builds a fresh AppConfig,
+        # so the global config needs no defensive copy here.
+        config = merge_local_config(base_config, local_entry.data, None)
+        source = ConfigSource.LOCAL
+    else:
+        # Start with global config (deep copy to avoid mutation)
+        config = base_config.model_copy(deep=True)
+        source = ConfigSource.GLOBAL
 
     # Apply CLI overrides (highest priority)
     if cli_overrides and cli_overrides.has_overrides:
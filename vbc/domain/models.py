@@ -286,6 +286,7 @@ class CompressionJob(BaseModel):
         verification_error: Verification error details when verification fails.
         expected_video_frames: Decoded source frames reported by FFmpeg, adjusted
             for any duplicated or dropped frames.
+        final_bitrate_bps: Overall output bitrate from FFmpeg's final statistics line.
     """
 
     source_file: VideoFile
@@ -303,3 +304,4 @@ class CompressionJob(BaseModel):
     verification_passed: bool = False
     verification_error: Optional[str] = None
     expected_video_frames: Optional[int] = None
+    final_bitrate_bps: Optional[int] = None
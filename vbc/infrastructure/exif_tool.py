@@ -1,4 +1,5 @@
 import exiftool
+import sys
 import threading
 from pathlib import Path
 from typing import Optional, List, Dict, Any
@@ -50,7 +51,8 @@ class ExifToolAdapter:
                         "257": "Canon",
                         "260": "JVC",
                     }
-                    return mts_map.get(value_str, value_str)
+                    # Camera names repeat across a whole library; share one copy.
+                    return sys.intern(mts_map.get(value_str, value_str))
         return None
 
     def extract_tags(self, file_path: Path) -> Dict[str, Any]:
@@ -864,7 +864,9 @@ class FFmpegAdapter:
         frame_regex = re.compile(r"frame=\s*(\d+)")
         dup_regex = re.compile(r"dup=\s*(\d+)")
         drop_regex = re.compile(r"drop=\s*(\d+)")
+        bitrate_regex = re.compile(r"bitrate=\s*([\d.]+)kbits/s")
         reported_frames: Optional[int] = None
+        reported_bitrate_kbps: Optional[float] = None
         reported_duplicates = 0
         reported_drops = 0
         hw_cap_error = False
@@ -964,6 +966,9 @@ class FFmpegAdapter:
                 drop_match = drop_regex.search(line)
                 if drop_match:
                     reported_drops = int(drop_match.group(1))
+                bitrate_match = bitrate_regex.search(line)
+                if bitrate_match:
+                    reported_bitrate_kbps = float(bitrate_match.group(1))
 
             process.wait()
         except KeyboardInterrupt:
@@ -1063,6 +1068,8 @@ class FFmpegAdapter:
                     )
                 return
             job.status = JobStatus.COMPLETED
+            if reported_bitrate_kbps:
+                job.final_bitrate_bps = int(round(reported_bitrate_kbps * 1000))
             if reported_frames is not None:
                 job.expected_video_frames = max(
                     0,
@@ -1,8 +1,38 @@
 import os
 from pathlib import Path
-from typing import List, Generator
+from typing import List, Generator, Iterator
 from vbc.domain.models import VideoFile
 
+
+def iter_tree_files(root_dir: str) -> Iterator[os.DirEntry]:
+    """Yield file entries under root_dir in deterministic os.walk order.
+
+    Uses os.scandir directly so callers get DirEntry objects (name, path and
+    stat without building Path objects for every entry). Directories ending in
+    _out are pruned and directory symlinks are not followed, like os.walk.
+    """
+    if os.path.basename(os.path.normpath(root_dir)).endswith("_out"):
+        return
+    try:
+        with os.scandir(root_dir) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            yield entry
+        elif not entry.name.endswith("_out") and not entry.is_symlink():
+            subdirs.append(entry.path)
+
+    for subdir in subdirs:
+        yield from iter_tree_files(subdir)
+
 class FileScanner:
     """Recursively scans for video files in a directory."""
     
@@ -12,36 +42,23 @@ class FileScanner:
 
     def scan(self, root_dir: Path) -> Generator[VideoFile, None, None]:
         """Scans the directory and yields VideoFile objects."""
-        for root, dirs, files in os.walk(str(root_dir)):
-            root_path = Path(root)
-
-            # Skip output directories (ending in _out)
-            if root_path.name.endswith("_out"):
-                dirs[:] = [] # stop recursion into this branch
+        extensions = frozenset(self.extensions)
+        for entry in iter_tree_files(str(root_dir)):
+            # Check extension
+            if os.path.splitext(entry.name)[1].lower() not in extensions:
                 continue
 
-            # Ensure deterministic traversal: sort directories and files
-            dirs[:] = sorted(d for d in dirs if not d.endswith("_out"))
-            files.sort()
-
-            for file_name in files:
-                file_path = root_path / file_name
-                
-                # Check extension
-                if file_path.suffix.lower() not in self.extensions:
-                    continue
-                
-                # Check size
-                try:
-                    file_stat = file_path.stat()
-                    if file_stat.st_size < self.min_size_bytes:
-                        continue
-                        
-                    yield VideoFile(
-                        path=file_path,
-                        size_bytes=file_stat.st_size,
-                        source_mtime_ns=file_stat.st_mtime_ns,
-                    )
-                except OSError:
-                    # Skip files we can't access
+            # Check size
+            try:
+                file_stat = entry.stat()
+                if file_stat.st_size < self.min_size_bytes:
                     continue
+
+                yield VideoFile(
+                    path=Path(entry.path),
+                    size_bytes=file_stat.st_size,
+                    source_mtime_ns=file_stat.st_mtime_ns,
+                )
+            except OSError:
+                # Skip files we can't access
+                continue
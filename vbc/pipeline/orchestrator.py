@@ -16,14 +16,19 @@ Key responsibilities:
 
 import re
 import os
+import fcntl
+import functools
 import hashlib
 import json
 import threading
 import concurrent.futures
+import contextlib
+import itertools
 import shutil
 import logging
 import time
 import subprocess
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Union, TYPE_CHECKING, Tuple
@@ -41,7 +46,7 @@ if TYPE_CHECKING:
     from vbc.config.local_registry import LocalConfigRegistry
     from vbc.config.overrides import CliConfigOverrides
 from vbc.infrastructure.event_bus import EventBus
-from vbc.infrastructure.file_scanner import FileScanner
+from vbc.infrastructure.file_scanner import FileScanner, iter_tree_files
 from vbc.infrastructure.exif_tool import ExifToolAdapter
 from vbc.infrastructure.ffprobe import FFprobeAdapter
 from vbc.infrastructure.ffmpeg import (
@@ -63,18 +68,25 @@ from vbc.domain.models import (
     VideoMetadata,
 )
 from vbc.domain.events import (
+    ActionMessage,
     DiscoveryErrorEntry,
     DiscoveryStarted,
     DiscoveryFinished,
+    InputDirsChanged,
     JobStarted,
     JobCompleted,
     JobFailed,
     QueueUpdated,
     ProcessingFinished,
+    ProcessingPausedOnError,
     RefreshFinished,
+    RefreshRequested,
+    RepairFinished,
+    RepairStarted,
     RequestShutdown,
     ThreadControlEvent,
     InterruptRequested,
+    WaitingForInput,
 )
 from vbc.pipeline.error_file_mover import collect_error_entries, move_failed_files
 from vbc.pipeline.output_timestamps import apply_output_timestamps
@@ -90,12 +102,122 @@ _REQUIRED_VBC_VERIFY_TAGS = {
     "vbcfinishedat",
 }
 _MANIFEST_SETTLE_SECONDS = 1.0
+_MAX_RUNTIME_THREADS = 8  # upper bound for the '>' key
+_METADATA_PREFETCH_WORKERS = 4
+_QUEUE_PUBLISH_INTERVAL = 0.25
+
+# Per-job XMP tag arguments, rendered with %-formatting in _build_vbc_tag_args.
+_VBC_TAG_TEMPLATES = (
+    "-XMP:VBCOriginalName=%s",
+    "-XMP:VBCOriginalSize=%s",
+    "-XMP:VBCQuality=%s",
+    "-XMP:VBCOriginalBitrate=%s",
+    "-XMP:VBCEncoder=%s",
+    "-XMP:VBCFinishedAt=%s",
+    "-XMP:VBCSourceParts=%s",
+)
+_VBC_JSON_NOTES_TEMPLATE = "-XMP:VBCJsonNotes=%s"
+_EXIFTOOL_CONFIG_PATH = Path(__file__).resolve().parents[2] / "conf" / "exiftool.conf"
+
+# Static part of the deep metadata copy command; follows "-tagsFromFile <source>".
+_EXIFTOOL_COPY_TAG_ARGS = (
+    "-XMP:all",
+    "-QuickTime:all",
+    "-Keys:all",
+    "-UserData:all",
+    "-EXIF:all",
+    "-GPS:all",
+    "-XMP-exif:GPSLatitude<GPSLatitude",
+    "-XMP-exif:GPSLongitude<GPSLongitude",
+    "-XMP-exif:GPSAltitude<GPSAltitude",
+    "-XMP-exif:GPSPosition<GPSPosition",
+    "-QuickTime:GPSCoordinates<GPSPosition",
+    "-Keys:GPSCoordinates<GPSPosition",
+    # Fix for MTS/AVCHD missing dates in MP4
+    "-QuickTime:CreateDate<DateTimeOriginal",
+    "-QuickTime:ModifyDate<DateTimeOriginal",
+    "-QuickTime:TrackCreateDate<DateTimeOriginal",
+    "-QuickTime:TrackModifyDate<DateTimeOriginal",
+    "-QuickTime:MediaCreateDate<DateTimeOriginal",
+    "-QuickTime:MediaModifyDate<DateTimeOriginal",
+    "-QuickTime:CreationDate<DateTimeOriginal",
+    # Fix missing Make/Model
+    "-QuickTime:Make<Make",
+    "-QuickTime:Model<Model",
+    "-UserData:Make<Make",
+    "-UserData:Model<Model",
+)
 
 
 class VerificationAbortError(RuntimeError):
     """Raised when verification_fail_action='exit' requests process termination."""
 
 
+def _intern_opt(value: Any) -> Optional[str]:
+    """Intern a repeated metadata string (codec, pix_fmt, ...) so cached entries share storage."""
+    if value is None:
+        return None
+    return sys.intern(str(value))
+
+
+def _list_dir_entries(directory: Union[str, Path]) -> Optional[Dict[str, os.DirEntry]]:
+    """Map entry names to DirEntry for one directory ({} if it does not exist).
+
+    Returns None when the directory exists but cannot be listed, so callers
+    fall back to probing individual paths.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+    except OSError:
+        return None
+
+
+_FICLONE = 0x40049409  # _IOW(0x94, 9, int) from linux/fs.h
+
+
+def _copy_file_clone(src: Path, dst: Path) -> None:
+    """shutil.copy2 that first tries a copy-on-write clone on Linux (btrfs, XFS).
+
+    A clone shares extents with the source, so no data is read or written.
+    FICLONE is a Linux ioctl number, so other platforms use shutil.copy2
+    directly. When the filesystem refuses the clone, both handles are closed
+    and shutil.copy2 (sendfile-accelerated) makes a regular copy; errors
+    opening either file propagate unchanged.
+    """
+    if not sys.platform.startswith("linux"):
+        shutil.copy2(src, dst)
+        return
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            cloned = False
+        else:
+            cloned = True
+    if cloned:
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+@functools.lru_cache(maxsize=None)
+def _rotation_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile an autorotate pattern once per process (never evicted)."""
+    return re.compile(pattern)
+
+
+@contextlib.contextmanager
+def _shutdown_on_exit(pool: concurrent.futures.Executor):
+    """Stop a helper pool on exit without waiting for its queued work."""
+    try:
+        yield pool
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def _emit_bell() -> None:
     """Write two terminal bells 0.3s apart directly to /dev/tty, bypassing Rich's stdout capture."""
     import time
@@ -209,12 +331,17 @@ class Orchestrator:
         self._shutdown_requested = False
         self._current_max_threads = config.general.threads
         self._active_threads = 0
+        # Jobs whose encode finished and gave up their slot, but which are still
+        # copying metadata / verifying output (counted in in_flight, not slots).
+        self._finalizing_jobs = 0
         self._thread_lock = threading.Condition()
         self._refresh_requested = False
         self._manifest_paths_requested: set[Path] = set()
         self._refresh_lock = threading.Lock()
         self._shutdown_event = threading.Event()  # Signal workers to stop
         self._wait_event = threading.Event()  # Signals wait loop to unblock
+        # Wakes the submit loop: a job finished, a refresh arrived, or slots opened.
+        self._loop_wakeup = threading.Event()
         self._restart_after_wait = False  # True = R pressed; False = S/Ctrl+C
         self._pause_requested = False
         self._pause_message: Optional[str] = None
@@ -239,8 +366,6 @@ class Orchestrator:
         self._setup_subscriptions()
 
     def _setup_subscriptions(self):
-        from vbc.domain.events import RefreshRequested, InputDirsChanged
-
         self.event_bus.subscribe(RequestShutdown, self._on_shutdown_request)
         self.event_bus.subscribe(ThreadControlEvent, self._on_thread_control)
         self.event_bus.subscribe(RefreshRequested, self._on_refresh_request)
@@ -262,10 +387,10 @@ class Orchestrator:
                 self._shutdown_requested = True
                 message = "SHUTDOWN requested (press S to cancel)"
                 self._wait_event.set()  # Wake up wait loop if waiting
-            self._thread_lock.notify_all()
+            # Workers queued for a slot stay parked: S is a toggle, and a
+            # cancelled shutdown must still run the jobs they already hold.
+        self._loop_wakeup.set()
         # Publish feedback message
-        from vbc.domain.events import ActionMessage
-
         self.event_bus.publish(ActionMessage(message=message))
 
     def _on_thread_control(self, event: ThreadControlEvent):
@@ -275,11 +400,13 @@ class Orchestrator:
         old_val = self._current_max_threads
         with self._thread_lock:
             requested = self._current_max_threads + event.change
-            self._current_max_threads = max(1, min(8, requested))
-            self._thread_lock.notify_all()
+            self._current_max_threads = max(1, min(_MAX_RUNTIME_THREADS, requested))
+            # Only a raised limit opens slots; wake one waiter per new slot.
+            opened = self._current_max_threads - old_val
+            if opened > 0:
+                self._thread_lock.notify(opened)
+                self._loop_wakeup.set()
         # Publish feedback message (like old vbc.py lines 769, 776)
-        from vbc.domain.events import ActionMessage
-
         if self._current_max_threads != old_val:
             self.event_bus.publish(
                 ActionMessage(
@@ -309,6 +436,7 @@ class Orchestrator:
         # Also wake the wait loop (if active) with restart intent
         self._restart_after_wait = True
         self._wait_event.set()
+        self._loop_wakeup.set()
 
     def _take_refresh_request(self) -> tuple[bool, List[Path]]:
         """Atomically consume one full refresh or a batch of manifest paths."""
@@ -341,8 +469,6 @@ class Orchestrator:
     def _on_interrupt_requested(self, event: InterruptRequested):
         """Handle Ctrl+C interrupt from keyboard listener."""
         self.logger.info("Interrupt requested (Ctrl+C) - stopping orchestrator...")
-        from vbc.domain.events import ActionMessage
-
         self.event_bus.publish(
             ActionMessage(message="Ctrl+C - interrupting active compressions...")
         )
@@ -394,11 +520,8 @@ class Orchestrator:
     def _find_input_folder(self, file_path: Path) -> Optional[Path]:
         """Find which input folder contains this file."""
         for input_dir in self._folder_mapping.keys():
-            try:
-                file_path.relative_to(input_dir)
+            if file_path.is_relative_to(input_dir):
                 return input_dir
-            except ValueError:
-                continue
         return None
 
     def _get_metadata(
@@ -424,7 +547,11 @@ class Orchestrator:
                 )
                 return None
 
-        # Check if already cached
+        # Cache hits skip the lock: entries are only ever added, and a single
+        # dict lookup is atomic.
+        cached = self._metadata_cache.get(file_path)
+        if cached is not None:
+            return cached
         with self._metadata_lock:
             cached = self._metadata_cache.get(file_path)
             if cached is not None:
@@ -611,8 +738,6 @@ class Orchestrator:
         if not repair_entries:
             return []
 
-        from vbc.domain.events import ActionMessage, RepairFinished, RepairStarted
-
         self.logger.info(
             f"Auto-repair pass: {len(repair_entries)} candidate(s) from current session"
         )
@@ -667,25 +792,101 @@ class Orchestrator:
         )
         return repaired_paths
 
-    def _prune_failed_pending(self, pending) -> int:
-        if not self._metadata_failed_paths:
-            return 0
-        failed_paths = self._metadata_failed_paths
-        if not failed_paths:
-            return 0
-        from collections import deque
+    def _preload_pending_head(self, pending, limit: int = 25) -> int:
+        """Resolve metadata for the queue head shown in the UI, dropping failures.
 
-        kept = deque()
+        Metadata failures are only registered for files whose metadata was just
+        requested, so cleanup is limited to this window; anything failed deeper
+        in the deque is skipped when the submit loop dequeues it.
+        """
+        failed_paths = self._metadata_failed_paths
+        kept = []
         removed = 0
-        while pending:
-            vf = pending.popleft()
-            if vf.path in failed_paths:
-                removed += 1
-                continue
-            kept.append(vf)
-        pending.extend(kept)
+        try:
+            while pending and len(kept) < limit:
+                batch = [
+                    pending.popleft()
+                    for _ in range(min(limit - len(kept), len(pending)))
+                ]
+                to_probe = [
+                    vf
+                    for vf in batch
+                    if not vf.metadata and vf.path not in failed_paths
+                ]
+                try:
+                    self._probe_metadata_batch(to_probe)
+                except BaseException:
+                    kept.extend(batch)
+                    raise
+                for vf in batch:
+                    if vf.path in failed_paths:
+                        removed += 1
+                        continue
+                    kept.append(vf)
+        finally:
+            pending.extendleft(reversed(kept))
         return removed
 
+    def _prefetch_pending_head(
+        self,
+        pending,
+        pool: concurrent.futures.Executor,
+        prefetching: Dict[Path, concurrent.futures.Future],
+        limit: int = 25,
+    ) -> None:
+        """Queue background metadata probes for the queue head without blocking.
+
+        Files that failed in an earlier probe are dropped from the head window
+        first. Results are stored on the VideoFile by the probe thread, which
+        then wakes the submit loop so the queue view is republished. Nothing is
+        queued once shutdown has been requested: those files will not run.
+        """
+        if self._shutdown_requested or self._shutdown_event.is_set():
+            return
+        failed_paths = self._metadata_failed_paths
+        if failed_paths:
+            head = [pending.popleft() for _ in range(min(limit, len(pending)))]
+            pending.extendleft(
+                reversed([vf for vf in head if vf.path not in failed_paths])
+            )
+        for path in [path for path, future in prefetching.items() if future.done()]:
+            del prefetching[path]
+        for vf in itertools.islice(pending, limit):
+            if vf.metadata or vf.path in failed_paths or vf.path in prefetching:
+                continue
+            future = pool.submit(self._get_metadata, vf)
+            prefetching[vf.path] = future
+            future.add_done_callback(
+                lambda done, vf=vf: self._store_prefetched_metadata(vf, done)
+            )
+
+    def _store_prefetched_metadata(
+        self, video_file: VideoFile, future: concurrent.futures.Future
+    ) -> None:
+        if not future.cancelled() and future.exception() is None:
+            metadata = future.result()
+            if metadata is not None and video_file.metadata is None:
+                video_file.metadata = metadata
+        self._loop_wakeup.set()
+
+    def _probe_metadata_batch(self, files: List[VideoFile]) -> None:
+        """Resolve metadata for several files with overlapping ffprobe subprocesses.
+
+        The probe threads spend their time waiting on ffprobe/ExifTool output,
+        so a small pool hides spawn latency without competing for the GIL.
+        """
+        if len(files) <= 1:
+            for vf in files:
+                vf.metadata = self._get_metadata(vf)
+            return
+        workers = min(len(files), (os.cpu_count() or 1) * 2)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="vbc-probe"
+        ) as pool:
+            results = list(pool.map(self._get_metadata, files))
+        for vf, metadata in zip(files, results):
+            vf.metadata = metadata
+
     def _build_metadata(
         self, video_file: VideoFile, stream_info: Dict[str, Any]
     ) -> VideoMetadata:
@@ -699,13 +900,13 @@ class Orchestrator:
         metadata = VideoMetadata(
             width=width,
             height=height,
-            codec=str(stream_info.get("codec", "unknown") or "unknown"),
-            audio_codec=stream_info.get("audio_codec"),
+            codec=sys.intern(str(stream_info.get("codec", "unknown") or "unknown")),
+            audio_codec=_intern_opt(stream_info.get("audio_codec")),
             fps=float(stream_info.get("fps") or 0.0),
             bitrate_kbps=stream_info.get("bitrate_kbps"),
             megapixels=megapixels,
-            color_space=stream_info.get("color_space"),
-            pix_fmt=stream_info.get("pix_fmt"),
+            color_space=_intern_opt(stream_info.get("color_space")),
+            pix_fmt=_intern_opt(stream_info.get("pix_fmt")),
             duration=float(stream_info.get("duration") or 0.0),
             vbc_encoded=vbc_encoded,
         )
@@ -1026,8 +1227,10 @@ class Orchestrator:
         if cfg.general.manual_rotation is not None:
             return cfg.general.manual_rotation
         filename = file.path.name
+        # First pattern in config order wins, so patterns are tried one by
+        # one rather than fused into a single alternation.
         for pattern, angle in cfg.autorotate.patterns.items():
-            if re.search(pattern, filename):
+            if _rotation_pattern(pattern).search(filename):
                 return angle
         return None
 
@@ -1126,17 +1329,18 @@ class Orchestrator:
         vbc_json_notes: Optional[str] = None,
         source_parts: str = "1",
     ) -> List[str]:
-        tags = [
-            f"-XMP:VBCOriginalName={source_path.name}",
-            f"-XMP:VBCOriginalSize={original_size}",
-            f"-XMP:VBCQuality={quality_label}",
-            f"-XMP:VBCOriginalBitrate={original_bitrate_label}",
-            f"-XMP:VBCEncoder={encoder}",
-            f"-XMP:VBCFinishedAt={finished_at}",
-            f"-XMP:VBCSourceParts={source_parts}",
-        ]
+        values = (
+            source_path.name,
+            original_size,
+            quality_label,
+            original_bitrate_label,
+            encoder,
+            finished_at,
+            source_parts,
+        )
+        tags = [fmt % (value,) for fmt, value in zip(_VBC_TAG_TEMPLATES, values)]
         if vbc_json_notes:
-            tags.append(f"-XMP:VBCJsonNotes={vbc_json_notes}")
+            tags.append(_VBC_JSON_NOTES_TEMPLATE % (vbc_json_notes,))
         return tags
 
     def _copy_deep_metadata(
@@ -1154,7 +1358,8 @@ class Orchestrator:
         record_error_marker: bool = True,
     ) -> None:
         """Copy full metadata from source to output using ExifTool (legacy behavior)."""
-        config_path = Path(__file__).resolve().parents[2] / "conf" / "exiftool.conf"
+        config_path = _EXIFTOOL_CONFIG_PATH
+        has_config = config_path.exists()
         vbc_tags = self._build_vbc_tag_args(
             source_path,
             quality_label,
@@ -1167,41 +1372,11 @@ class Orchestrator:
         )
 
         exiftool_cmd = ["exiftool"]
-        if config_path.exists():
+        if has_config:
             exiftool_cmd.extend(["-config", str(config_path)])
-        exiftool_cmd.extend(
-            [
-                "-m",
-                "-tagsFromFile",
-                str(source_path),
-                "-XMP:all",
-                "-QuickTime:all",
-                "-Keys:all",
-                "-UserData:all",
-                "-EXIF:all",
-                "-GPS:all",
-                "-XMP-exif:GPSLatitude<GPSLatitude",
-                "-XMP-exif:GPSLongitude<GPSLongitude",
-                "-XMP-exif:GPSAltitude<GPSAltitude",
-                "-XMP-exif:GPSPosition<GPSPosition",
-                "-QuickTime:GPSCoordinates<GPSPosition",
-                "-Keys:GPSCoordinates<GPSPosition",
-                # Fix for MTS/AVCHD missing dates in MP4
-                "-QuickTime:CreateDate<DateTimeOriginal",
-                "-QuickTime:ModifyDate<DateTimeOriginal",
-                "-QuickTime:TrackCreateDate<DateTimeOriginal",
-                "-QuickTime:TrackModifyDate<DateTimeOriginal",
-                "-QuickTime:MediaCreateDate<DateTimeOriginal",
-                "-QuickTime:MediaModifyDate<DateTimeOriginal",
-                "-QuickTime:CreationDate<DateTimeOriginal",
-                # Fix missing Make/Model
-                "-QuickTime:Make<Make",
-                "-QuickTime:Model<Model",
-                "-UserData:Make<Make",
-                "-UserData:Model<Model",
-            ]
-        )
-        if config_path.exists():
+        exiftool_cmd.extend(("-m", "-tagsFromFile", str(source_path)))
+        exiftool_cmd.extend(_EXIFTOOL_COPY_TAG_ARGS)
+        if has_config:
             exiftool_cmd.extend(vbc_tags)
         exiftool_cmd.extend(["-unsafe", "-overwrite_original", str(output_path)])
 
@@ -1235,7 +1410,8 @@ class Orchestrator:
                     )
                     subprocess.run(
                         exiftool_cmd,
-                        capture_output=True,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
                         text=True,
                         check=True,
                         timeout=timeout_s,
@@ -1262,11 +1438,10 @@ class Orchestrator:
                 except subprocess.CalledProcessError as e:
                     exif_elapsed = time.monotonic() - exif_start
                     stderr = (e.stderr or "").strip()
-                    stdout = (e.stdout or "").strip()
                     self.logger.warning(
                         f"EXIF_COPY_ERROR: {filename} attempt {attempt}/{max_attempts} "
                         f"elapsed={exif_elapsed:.2f}s returncode={e.returncode} "
-                        f"stderr={stderr!r} stdout={stdout!r}"
+                        f"stderr={stderr!r}"
                     )
                     self.logger.warning(
                         f"Failed to copy deep metadata for {filename}: {e}"
@@ -1301,7 +1476,8 @@ class Orchestrator:
                 remove_exiftool_tmp_for_target(output_path, self.logger)
                 subprocess.run(
                     exiftool_cmd,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
                     check=True,
                     timeout=timeout_s,
@@ -1312,10 +1488,9 @@ class Orchestrator:
                 )
             except subprocess.CalledProcessError as e:
                 stderr = (e.stderr or "").strip()
-                stdout = (e.stdout or "").strip()
                 self.logger.warning(
                     f"Failed to copy deep metadata for {filename}: returncode={e.returncode} "
-                    f"stderr={stderr!r} stdout={stdout!r}"
+                    f"stderr={stderr!r}"
                 )
             except Exception as e:
                 self.logger.warning(f"Failed to copy deep metadata for {filename}: {e}")
@@ -1333,7 +1508,7 @@ class Orchestrator:
         source_parts: str = "1",
     ) -> None:
         """Write VBC tags only (no metadata copy)."""
-        config_path = Path(__file__).resolve().parents[2] / "conf" / "exiftool.conf"
+        config_path = _EXIFTOOL_CONFIG_PATH
         if not config_path.exists():
             self.logger.warning("ExifTool config not found; skipping VBC tags")
             return
@@ -1370,7 +1545,8 @@ class Orchestrator:
             remove_exiftool_tmp_for_target(output_path, self.logger)
             subprocess.run(
                 exiftool_cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
                 timeout=timeout_s,
@@ -1381,10 +1557,9 @@ class Orchestrator:
             )
         except subprocess.CalledProcessError as e:
             stderr = (e.stderr or "").strip()
-            stdout = (e.stdout or "").strip()
             self.logger.warning(
                 f"Failed to write VBC tags for {output_path.name}: returncode={e.returncode} "
-                f"stderr={stderr!r} stdout={stdout!r}"
+                f"stderr={stderr!r}"
             )
         except Exception as e:
             self.logger.warning(f"Failed to write VBC tags for {output_path.name}: {e}")
@@ -1492,8 +1667,6 @@ class Orchestrator:
 
     def _handle_verification_failure(self, message: str, action: str) -> None:
         """Handle verification failure according to configured action."""
-        from vbc.domain.events import ActionMessage
-
         # Audible alert for detected bad compression (double bell helper).
         _emit_bell()
 
@@ -1510,10 +1683,12 @@ class Orchestrator:
             return
 
         if normalized_action == "exit":
+            # Set the event before notifying: queued workers only leave their
+            # slot wait once _shutdown_event is set.
+            self._shutdown_event.set()
             with self._thread_lock:
                 self._shutdown_requested = True
                 self._thread_lock.notify_all()
-            self._shutdown_event.set()
             self._verification_abort_message = message
             self._wait_event.set()
             self.event_bus.publish(
@@ -2426,14 +2601,151 @@ class Orchestrator:
         request.drop_audio = drop_audio
         self._process_metadata_request(video_file)
 
+    def _discover_plain_dir(
+        self, input_dir: Path, output_dir: Path
+    ) -> Tuple[List[VideoFile], Dict[str, Any]]:
+        """Scan one regular input directory; returns (files_to_process, folder_stats).
+
+        Touches no shared orchestrator state, so several directories can be
+        scanned concurrently.
+        """
+        if self.config.general.debug:
+            self.logger.info(f"DISCOVERY_START: scanning {input_dir}")
+
+        # Single-pass discovery: collect stats and candidates in one walk
+        folder_total_files = 0
+        folder_ignored_small = 0
+        folder_already_compressed = 0
+        folder_ignored_err = 0
+        folder_ignored_err_entries = []
+        folder_files_to_process = []
+        # One scandir per output subdirectory answers the marker and output
+        # probes for every source file mapped into it.
+        output_listings: Dict[str, Optional[Dict[str, os.DirEntry]]] = {}
+
+        extensions = frozenset(self.file_scanner.extensions)
+        output_suffix = self._output_suffix_for_mode()
+        # Candidates are handled as plain strings; Path objects are only built
+        # for files that end up in the results.
+        input_root = str(input_dir)
+        input_prefix_len = len(os.path.join(input_root, ""))
+        output_root = str(output_dir)
+        min_size_bytes = self.file_scanner.min_size_bytes
+        clean_errors = self.config.general.clean_errors
+        cpu_fallback = self.config.general.cpu_fallback
+        for entry in iter_tree_files(input_root):
+            if os.path.splitext(entry.name)[1].lower() not in extensions:
+                continue
+
+            folder_total_files += 1
+
+            try:
+                file_stat = entry.stat()
+            except OSError:
+                continue
+
+            if file_stat.st_size < min_size_bytes:
+                folder_ignored_small += 1
+                continue
+
+            rel_stem = os.path.splitext(entry.path[input_prefix_len:])[0]
+            output_stem = os.path.join(output_root, rel_stem)
+            output_path = output_stem + output_suffix
+            err_path = output_stem + ".err"
+            output_parent, output_name = os.path.split(output_path)
+            if output_parent in output_listings:
+                listing = output_listings[output_parent]
+            else:
+                listing = _list_dir_entries(output_parent)
+                output_listings[output_parent] = listing
+
+            # Check for error markers FIRST (before timestamp check). The read
+            # (or unlink) itself doubles as the existence check.
+            may_have_marker = (
+                listing is None or os.path.basename(err_path) in listing
+            )
+            if may_have_marker and clean_errors:
+                try:
+                    os.unlink(err_path)  # Remove error marker
+                except FileNotFoundError:
+                    pass
+            elif may_have_marker:
+                try:
+                    with open(err_path) as err_file:
+                        err_content = err_file.read()
+                    # Distinguish hw_cap errors from regular errors
+                    if "Hardware is lacking required capabilities" in err_content:
+                        if not cpu_fallback:
+                            # hw_cap is not counted as ignored_err
+                            continue
+                        os.unlink(err_path)
+                    else:
+                        folder_ignored_err += 1
+                        folder_ignored_err_entries.append(
+                            DiscoveryErrorEntry(
+                                path=Path(entry.path),
+                                size_bytes=file_stat.st_size,
+                                error_message=(
+                                    err_content.strip() or "Error marker present"
+                                ),
+                            )
+                        )
+                        continue
+                except FileNotFoundError:
+                    pass
+                except (OSError, UnicodeDecodeError):
+                    folder_ignored_err += 1
+                    folder_ignored_err_entries.append(
+                        DiscoveryErrorEntry(
+                            path=Path(entry.path),
+                            size_bytes=file_stat.st_size,
+                            error_message="Unreadable .err marker",
+                        )
+                    )
+                    continue
+
+            # Check if already compressed (one stat covers existence and mtime)
+            output_mtime = None
+            if listing is None or output_name in listing:
+                try:
+                    output_mtime = os.stat(output_path).st_mtime
+                except (FileNotFoundError, NotADirectoryError):
+                    pass
+            if output_mtime is not None and output_mtime >= file_stat.st_mtime:
+                folder_already_compressed += 1
+                continue
+
+            # AV1 check is done during processing, not discovery
+            folder_files_to_process.append(
+                VideoFile(
+                    path=Path(entry.path),
+                    size_bytes=file_stat.st_size,
+                    source_mtime_ns=file_stat.st_mtime_ns,
+                )
+            )
+
+        if self.config.general.debug:
+            self.logger.info(
+                f"DISCOVERY_END ({input_dir.name}): found={folder_total_files}, to_process={len(folder_files_to_process)}, "
+                f"already_compressed={folder_already_compressed}, ignored_small={folder_ignored_small}, ignored_err={folder_ignored_err}"
+            )
+
+        # files_found = only files that could be processed (exclude ignored_small, ignored_err)
+        folder_stats = {
+            "files_found": folder_total_files - folder_ignored_small - folder_ignored_err,
+            "already_compressed": folder_already_compressed,
+            "ignored_small": folder_ignored_small,
+            "ignored_err": folder_ignored_err,
+            "ignored_err_entries": folder_ignored_err_entries,
+        }
+        return folder_files_to_process, folder_stats
+
     def _perform_discovery(
         self,
         input_dirs: Union[Path, List[Path]],
         manifest_paths: Optional[List[Path]] = None,
     ) -> tuple:
         """Performs file discovery across multiple directories and returns (files_to_process, discovery_stats)."""
-        import os
-
         input_dirs = self._normalize_input_dirs(input_dirs)
         exact_paths_by_dir: Optional[Dict[Path, List[Path]]] = None
         if manifest_paths is not None:
@@ -2452,6 +2764,10 @@ class Orchestrator:
             "ignored_err": 0,
             "ignored_err_entries": [],
         }
+        # Output mappings and metadata dirs are resolved in order; regular
+        # folders are only collected here and scanned afterwards.
+        dir_results: Dict[int, Tuple[List[VideoFile], Dict[str, Any]]] = {}
+        plain_dirs: List[Tuple[int, Path, Path]] = []
 
         for idx, input_dir in enumerate(input_dirs):
             selected_manifest_paths = (
@@ -2483,145 +2799,51 @@ class Orchestrator:
                     raise ValueError(
                         f"Errors directory mapping missing for {input_dir}"
                     )
-                metadata_files, metadata_stats = self._discover_metadata_dir(
+                dir_results[idx] = self._discover_metadata_dir(
                     input_dir,
                     output_dir,
                     errors_dir,
                     manifest_paths=selected_manifest_paths,
                 )
-                all_files.extend(metadata_files)
-                for key in (
-                    "files_found",
-                    "already_compressed",
-                    "ignored_small",
-                    "ignored_err",
-                ):
-                    total_stats[key] += metadata_stats[key]
-                total_stats["ignored_err_entries"].extend(
-                    metadata_stats["ignored_err_entries"]
-                )
                 continue
 
-            if self.config.general.debug:
-                self.logger.info(f"DISCOVERY_START: scanning {input_dir}")
-
-            # Single-pass discovery: collect stats and candidates in one walk
-            folder_total_files = 0
-            folder_ignored_small = 0
-            folder_already_compressed = 0
-            folder_ignored_err = 0
-            folder_ignored_err_entries = []
-            folder_files_to_process = []
-
-            for root, dirs, filenames in os.walk(str(input_dir)):
-                root_path = Path(root)
-                if root_path.name.endswith("_out"):
-                    dirs[:] = []
-                    continue
-
-                # Deterministic traversal
-                dirs[:] = sorted(d for d in dirs if not d.endswith("_out"))
-                filenames.sort()
-
-                for fname in filenames:
-                    fpath = root_path / fname
-                    if fpath.suffix.lower() not in self.file_scanner.extensions:
-                        continue
-
-                    folder_total_files += 1
-
-                    try:
-                        file_stat = fpath.stat()
-                    except OSError:
-                        continue
-
-                    if file_stat.st_size < self.file_scanner.min_size_bytes:
-                        folder_ignored_small += 1
-                        continue
-
-                    try:
-                        rel_path = fpath.relative_to(input_dir)
-                    except ValueError:
-                        rel_path = Path(fpath.name)
-                    output_suffix = self._output_suffix_for_mode()
-                    output_path = output_dir / rel_path.with_suffix(output_suffix)
-                    err_path = output_path.with_suffix(".err")
-
-                    # Check for error markers FIRST (before timestamp check)
-                    if err_path.exists():
-                        if self.config.general.clean_errors:
-                            err_path.unlink()  # Remove error marker
-                        else:
-                            # Distinguish hw_cap errors from regular errors
-                            try:
-                                err_content = err_path.read_text()
-                                if (
-                                    "Hardware is lacking required capabilities"
-                                    in err_content
-                                ):
-                                    if self.config.general.cpu_fallback:
-                                        err_path.unlink()
-                                    else:
-                                        # hw_cap is not counted as ignored_err
-                                        continue
-                                else:
-                                    folder_ignored_err += 1
-                                    folder_ignored_err_entries.append(
-                                        DiscoveryErrorEntry(
-                                            path=fpath,
-                                            size_bytes=file_stat.st_size,
-                                            error_message=(
-                                                err_content.strip()
-                                                or "Error marker present"
-                                            ),
-                                        )
-                                    )
-                            except (OSError, UnicodeDecodeError):
-                                folder_ignored_err += 1
-                                folder_ignored_err_entries.append(
-                                    DiscoveryErrorEntry(
-                                        path=fpath,
-                                        size_bytes=file_stat.st_size,
-                                        error_message="Unreadable .err marker",
-                                    )
-                                )
-                            if err_path.exists():
-                                continue
-
-                    # Check if already compressed
-                    if (
-                        output_path.exists()
-                        and output_path.stat().st_mtime >= file_stat.st_mtime
-                    ):
-                        folder_already_compressed += 1
-                        continue
-
-                    # AV1 check is done during processing, not discovery
-                    folder_files_to_process.append(
-                        VideoFile(
-                            path=fpath,
-                            size_bytes=file_stat.st_size,
-                            source_mtime_ns=file_stat.st_mtime_ns,
-                        )
+            plain_dirs.append((idx, input_dir, output_dir))
+
+        if len(plain_dirs) == 1:
+            _, input_dir, output_dir = plain_dirs[0]
+            results = [self._discover_plain_dir(input_dir, output_dir)]
+        elif plain_dirs:
+            # Directory walks are dominated by getdents/stat latency, which
+            # releases the GIL, so folders on separate disks scan in parallel.
+            workers = min(len(plain_dirs), (os.cpu_count() or 1) * 2)
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="vbc-discovery"
+            ) as pool:
+                results = list(
+                    pool.map(
+                        lambda job: self._discover_plain_dir(job[1], job[2]),
+                        plain_dirs,
                     )
-
-            # Aggregate stats
-            # files_found = only files that could be processed (exclude ignored_small, ignored_err)
-            total_stats["files_found"] += (
-                folder_total_files - folder_ignored_small - folder_ignored_err
-            )
-            total_stats["already_compressed"] += folder_already_compressed
-            total_stats["ignored_small"] += folder_ignored_small
-            total_stats["ignored_err"] += folder_ignored_err
-            total_stats["ignored_err_entries"].extend(folder_ignored_err_entries)
-
-            all_files.extend(folder_files_to_process)
-
-            if self.config.general.debug:
-                self.logger.info(
-                    f"DISCOVERY_END ({input_dir.name}): found={folder_total_files}, to_process={len(folder_files_to_process)}, "
-                    f"already_compressed={folder_already_compressed}, ignored_small={folder_ignored_small}, ignored_err={folder_ignored_err}"
                 )
+        else:
+            results = []
+        for (idx, _, _), result in zip(plain_dirs, results):
+            dir_results[idx] = result
+
+        # Merge in input_dirs order so counters and error entries stay stable.
+        for idx in sorted(dir_results):
+            folder_files, folder_stats = dir_results[idx]
+            all_files.extend(folder_files)
+            for key in (
+                "files_found",
+                "already_compressed",
+                "ignored_small",
+                "ignored_err",
+            ):
+                total_stats[key] += folder_stats[key]
+            total_stats["ignored_err_entries"].extend(
+                folder_stats["ignored_err_entries"]
+            )
 
         # Sort all files by filename for deterministic processing order
         all_files = sort_files(
@@ -2646,12 +2868,11 @@ class Orchestrator:
     def _trigger_critical_shutdown(self, reason: str):
         """Initiate immediate shutdown due to critical error (e.g. disk full/IO error)."""
         self.logger.error(f"CRITICAL SHUTDOWN: {reason}")
+        # Set the event before notifying so queued workers leave their slot wait.
+        self._shutdown_event.set()
         with self._thread_lock:
             self._shutdown_requested = True
             self._thread_lock.notify_all()
-        self._shutdown_event.set()
-        from vbc.domain.events import ActionMessage
-
         self.event_bus.publish(ActionMessage(message=f"CRITICAL ERROR: {reason}"))
 
     def _apply_output_timestamps(
@@ -2676,11 +2897,24 @@ class Orchestrator:
         source_path = video_file.path
         source_mtime_ns = video_file.source_mtime_ns or source_path.stat().st_mtime_ns
 
-        def _hash_file(path: Path, chunk_size: int = 8 * 1024 * 1024) -> str:
-            hasher = hashlib.sha256()
+        def _hash_file(path: Path) -> str:
+            # Duplicate detection only, not a security boundary: BLAKE2b is
+            # faster than SHA-256 in CPython's bundled implementation.
+            # file_digest runs the read loop in C over an unbuffered handle.
+            with open(path, "rb", buffering=0) as f:
+                return hashlib.file_digest(
+                    f, lambda: hashlib.blake2b(digest_size=16)
+                ).hexdigest()
+
+        sample_bytes = 4 * 1024 * 1024
+
+        def _sample_digest(path: Path) -> str:
+            # Head + tail only; callers guarantee size > 2 * sample_bytes.
+            hasher = hashlib.blake2b(digest_size=16)
             with open(path, "rb") as f:
-                for chunk in iter(lambda: f.read(chunk_size), b""):
-                    hasher.update(chunk)
+                hasher.update(f.read(sample_bytes))
+                f.seek(-sample_bytes, os.SEEK_END)
+                hasher.update(f.read(sample_bytes))
             return hasher.hexdigest()
 
         try:
@@ -2704,16 +2938,31 @@ class Orchestrator:
 
                 if src_size == dest_size:
                     try:
-                        src_hash = _hash_file(source_path)
-                        dest_hash = _hash_file(dest_path)
+                        # Hash both sides concurrently; file reads and digest
+                        # updates release the GIL.
+                        with concurrent.futures.ThreadPoolExecutor(
+                            max_workers=2, thread_name_prefix="vbc-hash"
+                        ) as hash_pool:
+
+                            def _same_digest(digest_fn) -> bool:
+                                src_future = hash_pool.submit(digest_fn, source_path)
+                                dest_future = hash_pool.submit(digest_fn, dest_path)
+                                return src_future.result() == dest_future.result()
+
+                            # Same-size videos that differ almost always differ
+                            # in their first/last MiBs; check those before a
+                            # full pass over both files.
+                            is_duplicate = (
+                                src_size <= 2 * sample_bytes
+                                or _same_digest(_sample_digest)
+                            ) and _same_digest(_hash_file)
                     except Exception as e:
                         self.logger.warning(
                             f"Failed to hash files for duplicate check ({source_path.name}): {e}"
                         )
-                        src_hash = None
-                        dest_hash = None
+                        is_duplicate = False
 
-                    if src_hash is not None and src_hash == dest_hash:
+                    if is_duplicate:
                         # Identical file exists in destination. Safe to delete source.
                         self.logger.info(
                             f"Duplicate found in output (hash match). Deleting source: {source_path}"
@@ -3243,7 +3492,12 @@ class Orchestrator:
             self.logger.info(f"PROCESS_START: {filename} (thread {thread_id})")
 
         with self._thread_lock:
-            while self._active_threads >= self._current_max_threads:
+            # Only an interrupt (Ctrl+C) releases queued workers early; a
+            # graceful shutdown (S) can be cancelled, so they keep waiting.
+            while (
+                self._active_threads >= self._current_max_threads
+                and not self._shutdown_event.is_set()
+            ):
                 self._thread_lock.wait()
 
             if self._shutdown_requested:
@@ -3271,7 +3525,7 @@ class Orchestrator:
                     self._manifest_inflight.discard(manifest_path)
                 with self._thread_lock:
                     self._active_threads -= 1
-                    self._thread_lock.notify_all()
+                    self._thread_lock.notify()
             return
 
         job = None
@@ -3285,6 +3539,7 @@ class Orchestrator:
         temp_fixed_file = None
         input_path = video_file.path
         stream_info = None
+        slot_released = False
 
         try:
             # Find which input folder contains this file
@@ -3331,6 +3586,10 @@ class Orchestrator:
                     )
                     return
 
+            if video_file.metadata is None:
+                # A background prefetch may have finished after this job was
+                # dispatched; reuse its probe instead of running ffprobe again.
+                video_file.metadata = self._metadata_cache.get(video_file.path)
             if video_file.metadata is not None:
                 stream_info = {
                     "width": video_file.metadata.width,
@@ -3393,10 +3652,6 @@ class Orchestrator:
                 self.event_bus.publish(JobFailed(job=job, error_message=err_msg))
                 return
 
-            input_path, temp_fixed_file = self._check_and_fix_color_space(
-                video_file.path, output_path, stream_info
-            )
-
             # 1. Metadata & Decision (using thread-safe cache)
             video_file.metadata = self._get_metadata(
                 video_file, base_metadata=stream_info
@@ -3444,12 +3699,11 @@ class Orchestrator:
                         or video_file.metadata.camera_raw
                         or ""
                     )
-                matched = False
-                for filter_pattern in self.config.general.filter_cameras:
-                    if filter_pattern.lower() in cam_model.lower():
-                        matched = True
-                        break
-                if not matched:
+                cam_model_lower = cam_model.lower()
+                if not any(
+                    filter_pattern.lower() in cam_model_lower
+                    for filter_pattern in self.config.general.filter_cameras
+                ):
                     self.event_bus.publish(
                         JobFailed(
                             job=CompressionJob(
@@ -3523,6 +3777,12 @@ class Orchestrator:
                 config_source=config_source,
             )
 
+            # Remux reserved color metadata only once the file is known to need
+            # an encode; skipped files never pay for the extra read+write pass.
+            input_path, temp_fixed_file = self._check_and_fix_color_space(
+                video_file.path, output_path, stream_info
+            )
+
             # 2. Compress
             job.status = JobStatus.PROCESSING
             self.event_bus.publish(JobStarted(job=job))
@@ -3590,6 +3850,13 @@ class Orchestrator:
 
             # Check final status after compression
             if job.status == JobStatus.COMPLETED:
+                # The encoder is done; ExifTool, verification and timestamps are
+                # subprocess/disk work, so hand the slot to the next encode now.
+                with self._thread_lock:
+                    self._active_threads -= 1
+                    self._finalizing_jobs += 1
+                    slot_released = True
+                    self._thread_lock.notify()
                 kept_original = False
                 if job.output_path.exists():
                     out_size = job.output_path.stat().st_size
@@ -3599,7 +3866,7 @@ class Orchestrator:
                         1.0 - job_config.general.min_compression_ratio
                     )
                     if kept_original:
-                        shutil.copy2(video_file.path, job.output_path)
+                        _copy_file_clone(video_file.path, job.output_path)
                         job.error_message = f"Ratio {ratio:.2f} above threshold, kept original: {filename}"
                         self.logger.info(
                             f"MIN_RATIO_SKIP: {filename} ratio={ratio:.2f} "
@@ -3642,10 +3909,15 @@ class Orchestrator:
                         and not kept_original
                     ):
                         try:
-                            output_info = self._get_output_info(job.output_path)
-                            output_bitrate_kbps = output_info.get("bitrate_kbps")
-                            if output_bitrate_kbps and output_bitrate_kbps > 0:
-                                output_bps = int(round(output_bitrate_kbps * 1000))
+                            # FFmpeg's final stats line already carries the
+                            # output bitrate; probe only when it was missing.
+                            output_bps = job.final_bitrate_bps
+                            if not output_bps:
+                                output_info = self._get_output_info(job.output_path)
+                                output_bitrate_kbps = output_info.get("bitrate_kbps")
+                                if output_bitrate_kbps and output_bitrate_kbps > 0:
+                                    output_bps = int(round(output_bitrate_kbps * 1000))
+                            if output_bps:
                                 self.logger.info(
                                     f"RATE_OUTPUT: {filename} "
                                     f"final_bitrate={output_bps} bps ({format_bps_human(output_bps)})"
@@ -3799,8 +4071,11 @@ class Orchestrator:
                         f"Failed to cleanup temp file {temp_fixed_file}: {e}"
                     )
             with self._thread_lock:
-                self._active_threads -= 1
-                self._thread_lock.notify_all()
+                if slot_released:
+                    self._finalizing_jobs -= 1
+                else:
+                    self._active_threads -= 1
+                    self._thread_lock.notify()
 
     def run(self, input_dirs: Union[Path, List[Path]]):
         input_dirs = self._normalize_input_dirs(input_dirs)
@@ -3836,8 +4111,6 @@ class Orchestrator:
                 raise VerificationAbortError(self._verification_abort_message)
 
             if self._pause_requested:
-                from vbc.domain.events import ProcessingPausedOnError
-
                 self.event_bus.publish(
                     ProcessingPausedOnError(
                         message=self._pause_message or "Verification failed"
@@ -3888,8 +4161,6 @@ class Orchestrator:
                 _emit_bell()
 
             # Publish WAITING state for UI
-            from vbc.domain.events import WaitingForInput
-
             self.event_bus.publish(WaitingForInput())
 
             # Block until R (restart) or S/Ctrl+C (exit)
@@ -4037,63 +4308,108 @@ class Orchestrator:
 
         # Show lightweight queue proxies immediately. FPS/duration are filled in
         # by the bounded metadata window below instead of blocking an empty UI.
-        self.event_bus.publish(QueueUpdated(pending_files=[vf for vf in pending]))
+        self.event_bus.publish(QueueUpdated(pending_files=list(pending)))
 
         # Optionally pre-load metadata for the first queue page. Worker-side
         # preflight deliberately leaves every pending task lightweight.
         if not self.config.general.preflight_in_worker:
-            for vf in list(pending)[:25]:
-                if not vf.metadata:
-                    vf.metadata = self._get_metadata(vf)
-            self._prune_failed_pending(pending)
+            self._preload_pending_head(pending)
 
         # Refresh the first page after its metadata has been resolved.
-        self.event_bus.publish(QueueUpdated(pending_files=[vf for vf in pending]))
+        self.event_bus.publish(QueueUpdated(pending_files=list(pending)))
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        # Probes for the queue head run here so submit_batch never waits on them.
+        prefetch_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_METADATA_PREFETCH_WORKERS,
+            thread_name_prefix="vbc-prefetch",
+        )
+        prefetching: Dict[Path, concurrent.futures.Future] = {}
+        last_queue_publish = 0.0
 
-            def submit_batch():
+        # Refresh rescans run here so they never stall job submission.
+        refresh_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="vbc-refresh"
+        )
+        refresh_future: Optional[concurrent.futures.Future] = None
+        refresh_request: Optional[Tuple[bool, List[Path], List[Path]]] = None
+        refresh_dispatched: set[Path] = set()
+
+        # Every in-flight job holds a pool thread (queued ones wait for a slot
+        # inside _process_file). submit_batch excludes at most one slot's worth
+        # of finalizing jobs from its window, so in_flight never exceeds
+        # (prefetch_factor + 1) * threads and this pool never queues a job.
+        # Threads are spawned on demand, so the headroom costs nothing idle.
+        thread_cap = max(_MAX_RUNTIME_THREADS, self._current_max_threads)
+        pool_size = (self.config.general.prefetch_factor + 1) * thread_cap
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=pool_size
+        ) as executor, _shutdown_on_exit(prefetch_pool), _shutdown_on_exit(
+            refresh_pool
+        ):
+
+            process_file = self._process_file
+            failed_paths = self._metadata_failed_paths
+
+            def wake_loop(_future) -> None:
+                self._loop_wakeup.set()
+
+            def submit_batch(force_publish: bool = False):
                 """Submit files up to max_inflight limit"""
+                nonlocal last_queue_publish
                 max_inflight = (
                     self.config.general.prefetch_factor * self._current_max_threads
                 )
+                # Jobs that are only finalizing metadata no longer hold a slot,
+                # so they do not count against the submit window, capped at the
+                # slot count to keep in_flight within the executor's size.
+                excluded = min(self._finalizing_jobs, self._current_max_threads)
                 while (
-                    len(in_flight) < max_inflight
+                    len(in_flight) - excluded < max_inflight
                     and pending
                     and not self._shutdown_requested
                     and not self._pause_requested
                 ):
                     vf = pending.popleft()
-                    if vf.path in self._metadata_failed_paths:
+                    if vf.path in failed_paths:
                         continue
-                    future = executor.submit(self._process_file, vf)
+                    future = executor.submit(process_file, vf)
+                    future.add_done_callback(wake_loop)
                     in_flight[future] = vf
+                    if refresh_future is not None:
+                        refresh_dispatched.add(vf.identity_path)
 
-                # Pre-load metadata for the next UI page unless preflight is
+                # Prefetch metadata for the next UI page unless preflight is
                 # configured to consume worker slots instead.
                 if not self.config.general.preflight_in_worker:
-                    for vf in list(pending)[:25]:
-                        if not vf.metadata:
-                            vf.metadata = self._get_metadata(vf)
-                    self._prune_failed_pending(pending)
+                    self._prefetch_pending_head(pending, prefetch_pool, prefetching)
 
-                # Update UI with current pending files (store VideoFile objects, not just paths)
-                self.event_bus.publish(
-                    QueueUpdated(pending_files=[vf for vf in pending])
-                )
+                # Update UI with current pending files (store VideoFile objects,
+                # not just paths). Copying the deque is O(queue), so routine
+                # updates are throttled; the loop's poll timeout flushes the
+                # last one, and an emptied queue is always shown at once.
+                now = time.monotonic()
+                if (
+                    force_publish
+                    or not pending
+                    or now - last_queue_publish >= _QUEUE_PUBLISH_INTERVAL
+                ):
+                    last_queue_publish = now
+                    self.event_bus.publish(
+                        QueueUpdated(pending_files=list(pending))
+                    )
 
             try:
                 # Initial batch submission
-                submit_batch()
-
-                # Process futures as they complete
-                while in_flight:
-                    current_futures = set(in_flight.keys())
-                    done, _ = concurrent.futures.wait(
-                        current_futures,
-                        timeout=1.0,
-                        return_when=concurrent.futures.FIRST_COMPLETED,
-                    )
+                submit_batch(force_publish=True)
+
+                # Process futures as they complete. Completions, refresh
+                # requests and thread changes set the wakeup event; the timeout
+                # only backs up state that is polled (pause, shutdown).
+                while in_flight or refresh_future is not None:
+                    self._loop_wakeup.wait(timeout=1.0)
+                    self._loop_wakeup.clear()
+                    done = [future for future in in_flight if future.done()]
 
                     for future in done:
                         try:
@@ -4104,9 +4420,12 @@ class Orchestrator:
                             logging.error(f"Future failed with exception: {e}")
                         del in_flight[future]
 
-                    full_refresh, ready_manifest_paths = (
-                        self._take_refresh_request()
-                    )
+                    if refresh_future is None:
+                        full_refresh, ready_manifest_paths = (
+                            self._take_refresh_request()
+                        )
+                    else:
+                        full_refresh, ready_manifest_paths = False, []
                     if full_refresh or ready_manifest_paths:
                         if full_refresh and self._pending_input_dirs is not None:
                             refresh_dirs = self._pending_input_dirs
@@ -4118,12 +4437,35 @@ class Orchestrator:
                         else:
                             refresh_dirs = list(self._folder_mapping.keys())
 
-                        new_files, new_stats = self._perform_discovery(
+                        # Rescan on the refresh thread; jobs keep being
+                        # submitted meanwhile, and everything dispatched before
+                        # the result is applied stays out of the new queue.
+                        refresh_dispatched = {
+                            vf.identity_path for vf in in_flight.values()
+                        }
+                        refresh_request = (
+                            full_refresh,
+                            ready_manifest_paths,
+                            refresh_dirs,
+                        )
+                        refresh_future = refresh_pool.submit(
+                            self._perform_discovery,
                             refresh_dirs,
                             manifest_paths=(
                                 None if full_refresh else ready_manifest_paths
                             ),
                         )
+                        refresh_future.add_done_callback(wake_loop)
+
+                    refreshed = False
+                    if refresh_future is not None and refresh_future.done():
+                        full_refresh, ready_manifest_paths, refresh_dirs = (
+                            refresh_request
+                        )
+                        finished_refresh = refresh_future
+                        refresh_future = None
+                        refresh_request = None
+                        new_files, new_stats = finished_refresh.result()
                         if self._shutdown_requested:
                             self._defer_refresh_request(
                                 full_refresh,
@@ -4136,9 +4478,11 @@ class Orchestrator:
                                 len(ready_manifest_paths),
                             )
                             continue
-                        in_flight_paths = {
+                        in_flight_paths = refresh_dispatched | {
                             vf.identity_path for vf in in_flight.values()
                         }
+                        refresh_dispatched = set()
+                        refreshed = True
                         old_pending_paths = {
                             vf.identity_path for vf in pending
                         }
@@ -4170,8 +4514,11 @@ class Orchestrator:
                                 self.file_scanner.extensions,
                             )
 
-                        pending = deque(new_pending_list)
-                        self._prune_failed_pending(pending)
+                        pending = deque(
+                            vf
+                            for vf in new_pending_list
+                            if vf.path not in failed_paths
+                        )
                         self.event_bus.publish(
                             RefreshFinished(added=added, removed=removed)
                         )
@@ -4196,8 +4543,6 @@ class Orchestrator:
                                 )
                             )
 
-                        from vbc.domain.events import ActionMessage
-
                         if added > 0 and removed > 0:
                             message = (
                                 f"Refreshed: +{added} new, -{removed} removed"
@@ -4224,13 +4569,17 @@ class Orchestrator:
                                 len(ready_manifest_paths),
                             )
 
-                    # Submit more files to maintain queue
-                    submit_batch()
+                    # Submit more files to maintain queue; a refreshed queue is
+                    # published right away.
+                    submit_batch(force_publish=refreshed)
 
-                    # Exit if shutdown requested and no more in flight
+                    # Exit if shutdown requested and no more in flight (a
+                    # running refresh is awaited so its result can be deferred)
                     if (
-                        self._shutdown_requested or self._pause_requested
-                    ) and not in_flight:
+                        (self._shutdown_requested or self._pause_requested)
+                        and not in_flight
+                        and refresh_future is None
+                    ):
                         if self._pause_requested:
                             self.logger.info(
                                 "Pause requested after verification failure, exiting processing loop"
@@ -4241,8 +4590,9 @@ class Orchestrator:
                             )
                         break
 
-                # After all futures done, give UI one more refresh cycle
-                time.sleep(1.5)
+                # No grace sleep for the UI: subscribers update UIState
+                # synchronously inside publish(), and the dashboard renders the
+                # final state on its next tick or when it stops.
                 if self._verification_abort_message:
                     raise VerificationAbortError(self._verification_abort_message)
                 if not self._shutdown_requested and not self._pause_requested:
@@ -4259,8 +4609,6 @@ class Orchestrator:
                 self.logger.info(
                     "Ctrl+C detected - stopping new tasks and interrupting active jobs..."
                 )
-                from vbc.domain.events import ActionMessage
-
                 self.event_bus.publish(InterruptRequested())
                 self.event_bus.publish(
                     ActionMessage(
@@ -4274,31 +4622,20 @@ class Orchestrator:
                 # Stop accepting new tasks
                 self._shutdown_requested = True
 
-                # Cancel all pending futures (not yet started)
-                for future in list(in_flight.keys()):
-                    if not future.done():
-                        future.cancel()
+                # Cancel every queued (not yet started) future in one call;
+                # running jobs are left to observe _shutdown_event.
+                executor.shutdown(wait=False, cancel_futures=True)
 
                 # Wait for currently running tasks to see shutdown_event (max 10 seconds)
                 self.logger.info(
                     "Waiting for active ffmpeg processes to terminate (max 10s)..."
                 )
-                deadline = time.monotonic() + 10.0
-                while True:
-                    running = [future for future in in_flight if not future.done()]
-                    if not running:
-                        break
-                    remaining = deadline - time.monotonic()
-                    if remaining <= 0:
-                        break
-                    concurrent.futures.wait(
-                        running,
-                        timeout=min(0.2, remaining),
-                        return_when=concurrent.futures.FIRST_COMPLETED,
+                _, still_running = concurrent.futures.wait(in_flight, timeout=10.0)
+                if still_running:
+                    self.logger.warning(
+                        f"{len(still_running)} job(s) still running after 10s shutdown wait"
                     )
 
-                # Force shutdown after timeout
-                executor.shutdown(wait=False, cancel_futures=True)
                 self.logger.info("Shutdown complete")
 
                 # Re-raise to propagate to main
@@ -1,3 +1,4 @@
+import os
 import random
 from pathlib import Path
 from typing import List
@@ -49,18 +50,19 @@ def sort_files(
     if mode == "dir":
         files_by_dir = {input_dir: [] for input_dir in input_dirs}
         leftovers: List[VideoFile] = []
+        # Match on string prefixes (first input dir wins) instead of raising
+        # ValueError from relative_to() for every non-matching dir.
+        dir_prefixes = [
+            (os.path.join(str(input_dir), ""), input_dir) for input_dir in input_dirs
+        ]
 
         for vf in files:
-            matched = False
-            for input_dir in input_dirs:
-                try:
-                    rel_path = vf.origin_path.relative_to(input_dir)
-                except ValueError:
-                    continue
-                files_by_dir[input_dir].append((str(rel_path), vf))
-                matched = True
-                break
-            if not matched:
+            origin = str(vf.origin_path)
+            for prefix, input_dir in dir_prefixes:
+                if origin.startswith(prefix):
+                    files_by_dir[input_dir].append((origin[len(prefix):], vf))
+                    break
+            else:
                 leftovers.append(vf)
 
         ordered: List[VideoFile] = []
@@ -1,17 +1,86 @@
+import functools
 import logging
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn, DownloadColumn
 from rich.console import Console
 from vbc.utils.flv_repair import repair_flv_file
 from vbc.utils.reencode_repair import repair_via_reencode
 
+# Each re-encode is a libx264 ffmpeg that already uses several cores.
+_MAX_REPAIR_WORKERS = 4
+
 
 def _is_metadata_verification_failure(error_text: str) -> bool:
     normalized = error_text.lower()
     return "verification failed: missing vbc tags" in normalized
 
 
+def _repair_candidate(
+    candidate: Path,
+    dest_mkv: Path,
+    repaired_marker: Path,
+    error_code: str,
+    progress_callback: Callable[[int], None],
+    logger: Optional[logging.Logger],
+) -> Optional[Path]:
+    """Repair one candidate and restore it as dest_mkv; returns dest_mkv on success."""
+    if dest_mkv.exists():
+        if logger:
+            logger.warning(
+                f"Skipping repair for {candidate.name} - MKV already exists in source: {dest_mkv}"
+            )
+        return None
+
+    # STRATEGY 1: FLV Prefix Cut (Fast)
+    # Try this if no specific error code OR if it looks like it might be an FLV dump
+    reencode_input = candidate
+    temp_flv = None
+    if not error_code:
+        temp_flv = candidate.with_suffix(".repaired_temp.flv")
+        try:
+            if repair_flv_file(candidate, temp_flv):
+                reencode_input = temp_flv
+        except Exception:
+            temp_flv = None
+
+    # STRATEGY 2: Re-encode to MKV (Final output)
+    temp_mkv = candidate.with_suffix(".repaired_temp.mkv")
+    success = False
+    try:
+        # Inform user this might take longer
+        if logger:
+            logger.info(f"Attempting re-encode repair for {candidate.name}")
+        success = repair_via_reencode(reencode_input, temp_mkv, progress_callback=progress_callback)
+    except Exception:
+        pass
+
+    restored = None
+    if success:
+        dest_mkv.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            shutil.move(str(temp_mkv), str(dest_mkv))
+            repaired_marker.touch()
+            if logger:
+                logger.info(f"Repaired and restored: {candidate.name} -> {dest_mkv}")
+            restored = dest_mkv
+        except Exception as e:
+            if logger:
+                logger.error(f"Failed to move repaired file: {e}")
+            if temp_mkv.exists():
+                temp_mkv.unlink()
+    if temp_flv and temp_flv.exists():
+        try:
+            temp_flv.unlink()
+        except Exception:
+            pass
+    return restored
+
+
 def process_repairs(
     input_dirs: List[Path],
     errors_dir_map: Dict[Path, Path],
@@ -20,6 +89,7 @@ def process_repairs(
     target_files: Optional[List[Path]] = None,
     return_repaired_files: bool = False,
     auto_repair: bool = False,
+    max_workers: Optional[int] = None,
 ) -> Union[int, tuple[int, List[Path]]]:
     """
     Scans error directories for corrupted files and attempts to repair them.
@@ -35,14 +105,14 @@ def process_repairs(
         auto_repair: When True, this pass is part of the automatic in-session
             repair flow — repaired files are queued for compression in the
             same run, so the "re-run VBC" notice is suppressed.
+        max_workers: Number of repairs to run at once (defaults to the CPU
+            count, capped at _MAX_REPAIR_WORKERS).
 
     Returns:
         Number of successfully repaired files. When return_repaired_files=True,
         returns (count, repaired_file_paths).
     """
     console = Console()
-    total_repaired = 0
-    repaired_paths: List[Path] = []
     candidates_to_repair = []
 
     # 1. Scan for candidates first
@@ -143,9 +213,21 @@ def process_repairs(
     else:
         console.print(f"[bold cyan]Found {len(candidates_to_repair)} failed files in error directories.[/bold cyan]")
 
-    # 2. Process repairs
+    # 2. Process repairs. Each re-encode is its own ffmpeg process, so several
+    # run side by side; candidates restoring to the same MKV share one task and
+    # run in order, so the "MKV already exists" check still sees earlier ones.
+    groups: Dict[Path, List[tuple]] = {}
+    for index, entry in enumerate(candidates_to_repair, start=1):
+        groups.setdefault(entry[2], []).append((index, *entry))
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 1, _MAX_REPAIR_WORKERS)
+    max_workers = max(1, min(max_workers, len(groups)))
+
     total_bytes = sum(candidate_size for *_rest, candidate_size in candidates_to_repair)
-    processed_bytes = 0
+    progress_lock = threading.Lock()
+    finished_bytes = 0
+    active_bytes: Dict[int, int] = {}
+    repaired_by_index: Dict[int, Path] = {}
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -155,78 +237,53 @@ def process_repairs(
         console=console
     ) as progress:
         task = progress.add_task("Repairing corrupted files", total=total_bytes)
-        
-        for index, (candidate, dest_path, dest_mkv, repaired_marker, error_code, candidate_size) in enumerate(candidates_to_repair, start=1):
-            progress.update(
-                task,
-                description=f"Repairing [yellow]{candidate.name}[/yellow] ({index}/{len(candidates_to_repair)})",
-                completed=processed_bytes,
-            )
-            
-            success = False
-            repaired_file_path = None
-            temp_flv = None
 
-            if dest_mkv.exists():
-                if logger:
-                    logger.warning(
-                        f"Skipping repair for {candidate.name} - MKV already exists in source: {dest_mkv}"
-                    )
-                processed_bytes += candidate_size
-                progress.update(task, completed=processed_bytes)
-                continue
-            
-            # STRATEGY 1: FLV Prefix Cut (Fast)
-            # Try this if no specific error code OR if it looks like it might be an FLV dump
-            reencode_input = candidate
-            if not error_code:
-                temp_flv = candidate.with_suffix(".repaired_temp.flv")
-                try:
-                    if repair_flv_file(candidate, temp_flv):
-                        reencode_input = temp_flv
-                except Exception:
-                    temp_flv = None
-
-            # STRATEGY 2: Re-encode to MKV (Final output)
-            temp_mkv = candidate.with_suffix(".repaired_temp.mkv")
-            try:
-                def update_reencode_progress(output_size: int) -> None:
-                    current_file_bytes = min(max(output_size, 0), candidate_size)
-                    progress.update(task, completed=min(total_bytes, processed_bytes + current_file_bytes))
-
-                # Inform user this might take longer
-                if logger:
-                    logger.info(f"Attempting re-encode repair for {candidate.name}")
-                if repair_via_reencode(reencode_input, temp_mkv, progress_callback=update_reencode_progress):
-                    success = True
-                    repaired_file_path = temp_mkv
-                    dest_path = dest_mkv
-            except Exception:
-                pass
-            
-            if success and repaired_file_path:
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                try:
-                    import shutil
-                    shutil.move(str(repaired_file_path), str(dest_path))
-                    repaired_marker.touch()
-                    if logger:
-                        logger.info(f"Repaired and restored: {candidate.name} -> {dest_path}")
-                    total_repaired += 1
-                    repaired_paths.append(dest_path)
-                except Exception as e:
-                    if logger:
-                        logger.error(f"Failed to move repaired file: {e}")
-                    if repaired_file_path.exists():
-                        repaired_file_path.unlink()
-            if temp_flv and temp_flv.exists():
+        def update_file_progress(index: int, candidate_size: int, output_size: int) -> None:
+            with progress_lock:
+                active_bytes[index] = min(max(output_size, 0), candidate_size)
+                completed = finished_bytes + sum(active_bytes.values())
+                progress.update(task, completed=min(total_bytes, completed))
+
+        def finish_file_progress(index: int, candidate_size: int) -> None:
+            nonlocal finished_bytes
+            with progress_lock:
+                active_bytes.pop(index, None)
+                finished_bytes += candidate_size
+                completed = finished_bytes + sum(active_bytes.values())
+                progress.update(task, completed=min(total_bytes, completed))
+
+        def repair_group(entries: List[tuple]) -> None:
+            for index, candidate, _dest_path, dest_mkv, repaired_marker, error_code, candidate_size in entries:
+                progress.update(
+                    task,
+                    description=f"Repairing [yellow]{candidate.name}[/yellow] ({index}/{len(candidates_to_repair)})",
+                )
                 try:
-                    temp_flv.unlink()
-                except Exception:
-                    pass
-            
-            processed_bytes += candidate_size
-            progress.update(task, completed=processed_bytes)
+                    restored = _repair_candidate(
+                        candidate,
+                        dest_mkv,
+                        repaired_marker,
+                        error_code,
+                        functools.partial(update_file_progress, index, candidate_size),
+                        logger,
+                    )
+                finally:
+                    finish_file_progress(index, candidate_size)
+                if restored is not None:
+                    repaired_by_index[index] = restored
+
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vbc-repair")
+        try:
+            futures = [executor.submit(repair_group, entries) for entries in groups.values()]
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+
+    total_repaired = len(repaired_by_index)
+    repaired_paths = [repaired_by_index[index] for index in sorted(repaired_by_index)]
 
     if total_repaired > 0:
         summary_msg = f"Repaired {total_repaired}/{len(candidates_to_repair)} files."
@@ -205,7 +205,9 @@ def main():
                             cmd.append(f"-{k}={v}")
                         cmd.append(filepath)
                         
-                        subprocess.run(cmd, capture_output=True, text=True, check=True)
+                        subprocess.run(
+                            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True
+                        )
                         
                         # Size safety check: (1% of old size) + 10 KB buffer
                         new_size = os.path.getsize(filepath)